@@ -2,11 +2,123 @@
 
 """Agent class for genetic simulations in GeneticAlphabet2.2."""
 
+import functools
+import itertools
 import logging
 import random
 import parameters
 import genetic_strings
-from typing import Optional, List
+from typing import Callable, Dict, Optional, List, Tuple
+
+# Sorted so seeded random codes do not depend on set iteration order
+_NUCLEOTIDES = "".join(sorted(parameters.VALID_NUCLEOTIDES))
+
+# Precomputed codon sets for O(1) validation in Agent.init
+_VALID_CODONS = parameters.ALL_OP_CODONS | frozenset(
+    "".join(p) for p in itertools.product(_NUCLEOTIDES, repeat=parameters.CODON_SIZE)
+)
+
+def _op_copy(agent: "Agent", codon: str, pc: int, debug: bool) -> bool:
+    """COPY: append the codon to progeny_code."""
+    agent._progeny_parts.append(codon)
+    if debug:
+        logging.debug("COPY: Added %s to progeny_code", codon)
+    return False
+
+def _op_start(agent: "Agent", codon: str, pc: int, debug: bool) -> bool:
+    """START: record the codon's position in eip_ptr."""
+    agent.eip_ptr = pc
+    if debug:
+        logging.debug("START: Set eip_ptr to %d", pc)
+    return False
+
+def _op_stop(agent: "Agent", codon: str, pc: int, debug: bool) -> bool:
+    """STOP: halt execution."""
+    if debug:
+        logging.debug("STOP: Execution complete")
+    return True
+
+def _op_data(agent: "Agent", codon: str, pc: int, debug: bool) -> bool:
+    """Treat unrecognized codons as data and append them to progeny_code."""
+    agent._progeny_parts.append(codon)
+    if debug:
+        logging.debug("DATA: Added %s to progeny_code", codon)
+    return False
+
+_OP_HANDLERS: Dict[str, Callable[["Agent", str, int, bool], bool]] = {
+    "COPY": _op_copy,
+    "START": _op_start,
+    "STOP": _op_stop,
+}
+"""Handlers for operations with dedicated semantics; all others run as data."""
+
+_OPCODE_DISPATCH: Dict[str, Callable[["Agent", str, int, bool], bool]] = {
+    codon: _OP_HANDLERS[op]
+    for op, codons in parameters.OPERATIONS.items() if op in _OP_HANDLERS
+    for codon in codons
+}
+"""Jump table mapping each operation codon to its handler."""
+
+_CODON_LETTERS: Optional[Dict[str, str]] = None
+
+def _codon_letters() -> Dict[str, str]:
+    """Return cross_reference.CODON_LETTERS, importing it on first use."""
+    global _CODON_LETTERS
+    if _CODON_LETTERS is None:
+        from cross_reference import CODON_LETTERS  # Import lazily to avoid circular imports
+        _CODON_LETTERS = CODON_LETTERS
+    return _CODON_LETTERS
+
+def _translate_tape(tape: List[str]) -> str:
+    """Translate a list of codons to a one-letter amino acid sequence."""
+    # map() runs the lookups in C; codons without an amino acid map to ""
+    return "".join(map(_codon_letters().get, tape, itertools.repeat("")))
+
+_START_CODONS = parameters.OPERATION_SETS["START"]
+_STOP_CODONS = parameters.OPERATION_SETS["STOP"]
+
+@functools.lru_cache(maxsize=4096)
+def _parse_code(code: str) -> Optional[Tuple[str, ...]]:
+    """
+    Tokenize and validate code once per distinct code string.
+
+    Identical codes are common within a generation, since tournament
+    selection repeats parents and many mutations leave the code intact.
+
+    Returns:
+        The codons of code, or None if any codon is not valid.
+    """
+    tape = tuple(genetic_strings.tokenize(code))
+    if tape and all(codon in _VALID_CODONS for codon in tape):
+        return tape
+    return None
+
+@functools.lru_cache(maxsize=4096)
+def _plan_run(code: str) -> Tuple[Tuple[str, ...], Optional[int], int]:
+    """
+    Partially evaluate a complete run of code from PC 0.
+
+    A run depends only on the tape, so the outcome is computed once per
+    distinct code and replayed for every agent that carries it.
+
+    Returns:
+        Codons appended to progeny_code, the final eip_ptr (None if no
+        START ran) and the program counter after the run.
+    """
+    tape = _parse_code(code) or ()
+    progeny: List[str] = []
+    eip_ptr = None
+    pc = 0
+    while pc < len(tape):
+        codon = tape[pc]
+        pc += 1
+        if codon in _START_CODONS:
+            eip_ptr = pc - 1
+        elif codon in _STOP_CODONS:
+            break
+        else:
+            progeny.append(codon)
+    return tuple(progeny), eip_ptr, pc
 
 class Agent:
     def __init__(self, family_id: int):
@@ -18,12 +130,25 @@ class Agent:
         """
         self.family_id = family_id
         self.code: str = ""
-        self.progeny_code: str = ""
+        self._progeny_parts: List[str] = []
         self.program_counter: int = 0
         self.eip_ptr: Optional[int] = None
         self.valid: bool = False
         self.tape: List[str] = []
 
+    @property
+    def progeny_code(self) -> str:
+        """Progeny code produced so far, joined from the append buffer."""
+        return "".join(self._progeny_parts)
+
+    @progeny_code.setter
+    def progeny_code(self, value: str) -> None:
+        # Reuse the existing buffer rather than allocating a new list
+        parts = self._progeny_parts
+        parts.clear()
+        if value:
+            parts.append(value)
+
     def init(self, code: str, progeny_code: Optional[str] = None) -> bool:
         """
         Initialize the agent with genetic code.
@@ -40,16 +165,10 @@ class Agent:
             logging.error("Invalid code for agent (family_id=%d): %s", self.family_id, code)
             return False
 
-        # Tokenize code into codons
-        self.tape = [code[i:i + parameters.CODON_SIZE] 
-                     for i in range(0, len(code), parameters.CODON_SIZE)]
-        
-        # Validate codons (operations or valid nucleotides)
-        self.valid = len(self.tape) > 0 and all(
-            codon in sum(parameters.OPERATIONS.values(), []) or 
-            all(c in 'ATGCU' for c in codon) 
-            for codon in self.tape
-        )
+        # Tokenize and validate codons (operations or valid nucleotides), once per distinct code
+        tape = _parse_code(code)
+        self.tape = list(tape) if tape is not None else genetic_strings.tokenize(code)
+        self.valid = tape is not None
         
         if not self.valid:
             logging.error("Invalid code for agent (family_id=%d): %s", self.family_id, code)
@@ -69,38 +188,85 @@ class Agent:
         Returns:
             True if execution is complete, False if more iterations are needed.
         """
-        if not self.valid or self.program_counter >= len(self.tape):
-            logging.debug("Execution complete for agent (family_id=%d): progeny_code=%s, PC=%d", 
-                          self.family_id, self.progeny_code, self.program_counter)
+        # Check the level once so disabled debug logs never build their arguments
+        debug = logging.root.isEnabledFor(logging.DEBUG)
+        pc = self.program_counter
+        tape = self.tape
+        if not self.valid or pc >= len(tape):
+            if debug:
+                logging.debug("Execution complete for agent (family_id=%d): progeny_code=%s, PC=%d", 
+                              self.family_id, self.progeny_code, pc)
             return True
 
-        codon = self.tape[self.program_counter]
-        logging.debug("Processing codon: %s at PC=%d", codon, self.program_counter)
+        codon = tape[pc]
+        if debug:
+            logging.debug("Processing codon: %s at PC=%d", codon, pc)
         
-        # Handle operations
-        if codon in parameters.OPERATIONS["COPY"]:
-            self.progeny_code += codon
-            self.program_counter += 1
-            logging.debug("COPY: Added %s to progeny_code", codon)
-        elif codon in parameters.OPERATIONS["START"]:
-            self.eip_ptr = self.program_counter
-            self.program_counter += 1
-            logging.debug("START: Set eip_ptr to %d", self.eip_ptr)
-        elif codon in parameters.OPERATIONS["STOP"]:
-            self.program_counter += 1
-            logging.debug("STOP: Execution complete")
+        # Every operation advances by one codon; write the PC back once
+        self.program_counter = pc + 1
+        # Dispatch to the operation handler; unrecognized codons are data.
+        # Handlers reuse the level check above rather than logging unconditionally
+        if _OPCODE_DISPATCH.get(codon, _op_data)(self, codon, pc, debug):
             return True
-        else:
-            # Treat unrecognized codons as data
-            self.progeny_code += codon
-            self.program_counter += 1
-            logging.debug("DATA: Added %s to progeny_code", codon)
 
-        if parameters.DYNAMIC_MODE:
+        if debug and parameters.DYNAMIC_MODE:
             logging.debug("progeny_code=%s, program_counter=%d", 
-                          self.progeny_code, self.program_counter)
+                          self.progeny_code, pc + 1)
         return False
 
+    def run_to_completion(self, max_steps: Optional[int] = None) -> bool:
+        """
+        Execute the agent's genetic code until it halts.
+
+        Produces the same state as calling iteration() repeatedly, but runs
+        the whole loop in a single frame without per-codon dispatch or logging.
+
+        Args:
+            max_steps: Optional maximum number of codons to execute.
+
+        Returns:
+            True if execution is complete, False if max_steps was reached first.
+        """
+        if not self.valid:
+            return True
+
+        # Replay the precomputed run when it fits in the step budget
+        if self.program_counter == 0:
+            progeny, eip_ptr, end_pc = _plan_run(self.code)
+            if max_steps is None or max_steps >= end_pc:
+                self._progeny_parts.extend(progeny)
+                if eip_ptr is not None:
+                    self.eip_ptr = eip_ptr
+                self.program_counter = end_pc
+                logging.debug("Run for agent (family_id=%d) stopped at PC=%d, complete=%s",
+                              self.family_id, end_pc, True)
+                return True
+
+        tape = self.tape
+        end = len(tape)
+        pc = self.program_counter
+        limit = end if max_steps is None else min(end, pc + max_steps)
+        append = self._progeny_parts.append
+        done = False
+        while pc < limit:
+            codon = tape[pc]
+            if codon in _START_CODONS:
+                self.eip_ptr = pc
+            elif codon in _STOP_CODONS:
+                pc += 1
+                done = True
+                break
+            else:
+                # COPY and data codons both extend progeny_code
+                append(codon)
+            pc += 1
+
+        self.program_counter = pc
+        done = done or pc >= end
+        logging.debug("Run for agent (family_id=%d) stopped at PC=%d, complete=%s",
+                      self.family_id, pc, done)
+        return done
+
     def mutate(self) -> None:
         """
         Mutate the agent's code using genetic_strings.mutate.
@@ -120,16 +286,10 @@ class Agent:
         Returns:
             Amino acid sequence as a string.
         """
-        from cross_reference import CODON_TABLE  # Import locally to avoid circular imports
-        if not self.progeny_code:
+        progeny_code = self.progeny_code
+        if not progeny_code:
             return ""
-        tape = [self.progeny_code[i:i + parameters.CODON_SIZE] 
-                for i in range(0, len(self.progeny_code), parameters.CODON_SIZE)]
-        amino_acids = ""
-        for codon in tape:
-            if codon in CODON_TABLE and "letter" in CODON_TABLE[codon]:
-                amino_acids += CODON_TABLE[codon]["letter"]
-        return amino_acids
+        return _translate_tape(genetic_strings.tokenize(progeny_code))
 
     def evaluate_fitness(self, target_peptide: Optional[str] = None) -> float:
         """
@@ -141,13 +301,18 @@ class Agent:
         Returns:
             Fitness score, combining entropy and peptide match score.
         """
-        if not self.progeny_code:
+        progeny_code = self.progeny_code
+        if not progeny_code:
             return 0.0
-        entropy = genetic_strings.entropy(self.progeny_code)
-        base_fitness = len(self.progeny_code) * entropy
+        # Tokenize once and share the tape between entropy and translation
+        tape = genetic_strings.tokenize(progeny_code)
+        entropy = genetic_strings.entropy(progeny_code, tape)
+        base_fitness = len(progeny_code) * entropy
         
-        if target_peptide:
-            peptide = self.translate_to_peptide()
+        # Each codon yields at most one amino acid, so a progeny with fewer
+        # codons than the target cannot match and needs no translation
+        if target_peptide and len(tape) >= len(target_peptide):
+            peptide = _translate_tape(tape)
             # Increase weight of peptide match to prioritize correct peptides
             match_score = 1.0 if target_peptide in peptide else 0.0
             base_fitness += match_score * len(target_peptide) * 100.0  # Heavily weight peptide match
@@ -166,20 +331,52 @@ class Agent:
         Returns:
             Random genetic code string.
         """
-        nucleotides = 'ATGCU'
-        return ''.join(random.choice(nucleotides) for _ in range(length))
+        return ''.join(random.choices(_NUCLEOTIDES, k=length))
 
-    def reset(self) -> None:
+    def reset(self, family_id: Optional[int] = None) -> None:
         """
         Reset the agent's state.
+
+        Args:
+            family_id: Optional new family ID, for reusing the agent in another slot.
         """
+        if family_id is not None:
+            self.family_id = family_id
         self.code = ""
-        self.progeny_code = ""
+        self._progeny_parts.clear()
         self.program_counter = 0
         self.eip_ptr = None
         self.valid = False
         self.tape = []
 
+def evaluate_population(agents: List[Agent], target_peptide: Optional[str] = None,
+                        scores: Optional[Dict[str, float]] = None) -> List[float]:
+    """
+    Evaluate the fitness of every agent in a population.
+
+    Fitness depends only on progeny_code, so each distinct progeny code is
+    scored once and the result is shared by all agents that produced it.
+
+    Args:
+        agents: Agents to evaluate.
+        target_peptide: Optional target peptide sequence to search for.
+        scores: Optional cache of fitness by progeny code, filled in place. It
+            must only ever be used with the same target_peptide.
+
+    Returns:
+        Fitness scores in the same order as agents.
+    """
+    if scores is None:
+        scores = {}
+    fitnesses = []
+    for agent in agents:
+        progeny_code = agent.progeny_code
+        fitness = scores.get(progeny_code)
+        if fitness is None:
+            fitness = scores[progeny_code] = agent.evaluate_fitness(target_peptide)
+        fitnesses.append(fitness)
+    return fitnesses
+
 if __name__ == "__main__":
     import unittest
     from unittest.mock import patch
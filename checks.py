@@ -4,6 +4,12 @@
 
 from typing import List
 import parameters
+import genetic_strings
+
+_INSTRUCTION_SET = frozenset(parameters.INSTRUCTIONS)
+_DELETE_NUCLEOTIDES = str.maketrans("", "", "".join(parameters.VALID_NUCLEOTIDES))
+_START_CODONS = parameters.OPERATION_SETS["START"]
+_STOP_CODONS = parameters.OPERATION_SETS["STOP"]
 
 def check_list(code: str) -> bool:
     """
@@ -26,8 +32,11 @@ def check_list(code: str) -> bool:
     if len(code) % parameters.CODON_SIZE != 0:
         return False
 
-    tape = [code[i:i + parameters.CODON_SIZE] for i in range(0, len(code), parameters.CODON_SIZE)]
-    return all(codon in parameters.INSTRUCTIONS for codon in tape)
+    # Reject stray characters in one C-level pass before tokenizing
+    if code.translate(_DELETE_NUCLEOTIDES):
+        return False
+
+    return all(codon in _INSTRUCTION_SET for codon in genetic_strings.tokenize(code))
 
 def is_executable(instruction_list: List[str]) -> bool:
     """
@@ -46,10 +55,9 @@ def is_executable(instruction_list: List[str]) -> bool:
         return False
 
     start_found = False
-    for i, instruction in enumerate(instruction_list):
-        if instruction in parameters.OPERATIONS["START"]:
-            start_found = True
-            for j in range(i, len(instruction_list)):
-                if instruction_list[j] in parameters.OPERATIONS["STOP"]:
-                    return True
+    for instruction in instruction_list:
+        if not start_found:
+            start_found = instruction in _START_CODONS
+        elif instruction in _STOP_CODONS:
+            return True
     return False
@@ -10,7 +10,6 @@ import pandas as pd
 import matplotlib.pyplot as plt
 from collections import Counter
 from typing import List, Dict, Optional
-import parameters
 import genetic_strings
 from agent import Agent
 from simulation import Simulation
@@ -87,6 +86,9 @@ CODON_TABLE = {
     "GGG": {"name": "Glycine", "abbr": "Gly", "letter": "G"}
 }
 
+# Flat codon -> one-letter amino acid lookup; codons without a letter (stops) are omitted
+CODON_LETTERS = {codon: info["letter"] for codon, info in CODON_TABLE.items() if "letter" in info}
+
 def ensure_directories():
     """Create data and graphs directories if they don't exist."""
     for directory in [DATA_DIR, GRAPHS_DIR]:
@@ -96,16 +98,11 @@ def ensure_directories():
 
 def get_nucleotides(code: str) -> str:
     """Translate genetic code to amino acid sequence using codon table."""
-    tape = [code[i:i + parameters.CODON_SIZE] for i in range(0, len(code), parameters.CODON_SIZE)]
-    amino_acids = ""
-    for codon in tape:
-        if codon in CODON_TABLE and "letter" in CODON_TABLE[codon]:
-            amino_acids += CODON_TABLE[codon]["letter"]
-    return amino_acids
+    return "".join([CODON_LETTERS.get(codon, "") for codon in genetic_strings.tokenize(code)])
 
 def generate_random_sequences(n: int, lower_bound: int = 7, upper_bound: int = 100) -> List[str]:
     """Generate random amino acid sequences."""
-    letters = list(set([CODON_TABLE[key]["letter"] for key in CODON_TABLE if "letter" in CODON_TABLE[key]]))
+    letters = list(set(CODON_LETTERS.values()))
     sequences = []
     for _ in range(n):
         length = random.randint(lower_bound, upper_bound)
@@ -114,10 +111,12 @@ def generate_random_sequences(n: int, lower_bound: int = 7, upper_bound: int = 1
     return sequences
 
 def collect_framework_sequences(population_size: int, max_generations: int, max_steps: int, 
-                               initial_codes: List[str] = None) -> List[str]:
+                               initial_codes: List[str] = None, elite_count: int = 1,
+                               patience: Optional[int] = 20) -> List[str]:
     """Run simulation and collect progeny codes."""
     sim = Simulation(population_size=population_size, max_generations=max_generations, 
-                     max_steps=max_steps, initial_codes=initial_codes)
+                     max_steps=max_steps, initial_codes=initial_codes,
+                     elite_count=elite_count, patience=patience)
     best_agent = sim.run_simulation()
     sequences = []
     for agent in sim.population:
@@ -226,13 +225,15 @@ def cross_reference_sequences(framework_sequences: List[str], random_sequences:
 def run_cross_reference(population_size: int = 10, max_generations: int = 10, 
                         max_steps: int = 100, num_random: int = 100, 
                         initial_codes: List[str] = None, output_prefix: str = "cross_reference",
-                        target_peptide: Optional[str] = None) -> None:
+                        target_peptide: Optional[str] = None, elite_count: int = 1,
+                        patience: Optional[int] = 20) -> None:
     """Run cross-referencing experiment."""
     logging.info("Starting cross-reference experiment")
     
     # Collect framework sequences
     framework_sequences = collect_framework_sequences(population_size, max_generations, 
-                                                     max_steps, initial_codes)
+                                                     max_steps, initial_codes,
+                                                     elite_count=elite_count, patience=patience)
     logging.info(f"Collected {len(framework_sequences)} framework sequences")
     
     # Generate random sequences
@@ -255,8 +256,15 @@ if __name__ == "__main__":
     parser.add_argument("--output-prefix", type=str, default="cross_reference", help="Prefix for output files")
     parser.add_argument("--log-file", type=str, default="cross_reference.log", help="Log file path")
     parser.add_argument("--target-peptide", type=str, help="Target peptide sequence to search for")
+    parser.add_argument("--elite-count", type=int, default=1, 
+                        help="Fittest agents carried unchanged into each generation (0 disables elitism)")
+    parser.add_argument("--patience", type=int, default=20, 
+                        help="Stop after this many generations without fitness improvement "
+                             "(0 disables early stopping)")
     
     args = parser.parse_args()
+    if args.patience < 0:
+        parser.error("--patience must be 0 or greater")
     
     # Setup logging
     logging.basicConfig(filename=args.log_file, level=logging.INFO, 
@@ -269,4 +277,5 @@ if __name__ == "__main__":
             initial_codes = [line.strip() for line in f if line.strip()]
     
     run_cross_reference(args.population_size, args.max_generations, args.max_steps, 
-                        args.num_random, initial_codes, args.output_prefix, args.target_peptide)
+                        args.num_random, initial_codes, args.output_prefix, args.target_peptide,
+                        elite_count=args.elite_count, patience=args.patience)
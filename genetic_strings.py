@@ -2,17 +2,40 @@
 
 """String processing and mutation operations for genetic sequences."""
 
-from typing import List
+from collections import Counter
+from typing import List, Optional
 import math
 import random
+import re
 import parameters
 
-def entropy(code: str) -> float:
+_CODON_RE = re.compile(f".{{{parameters.CODON_SIZE}}}", re.DOTALL)
+_LOG_64 = math.log(64)
+
+def tokenize(code: str) -> List[str]:
+    """
+    Split a genetic code string into codons.
+
+    Args:
+        code: The genetic code string.
+
+    Returns:
+        List of codons; a trailing partial codon is kept as-is.
+    """
+    # Split whole codons in a single C-level regex scan
+    tape = _CODON_RE.findall(code)
+    tail = len(code) % parameters.CODON_SIZE
+    if tail:
+        tape.append(code[-tail:])
+    return tape
+
+def entropy(code: str, tape: Optional[List[str]] = None) -> float:
     """
     Calculate the entropy of a genetic code string based on codon frequencies.
 
     Args:
         code: The genetic code string.
+        tape: Optional codons of code, if the caller has already tokenized it.
 
     Returns:
         The entropy value, or 0.0 if the code is empty.
@@ -20,17 +43,14 @@ def entropy(code: str) -> float:
     if not code:
         return 0.0
 
-    tape = [code[i:i + parameters.CODON_SIZE] for i in range(0, len(code), parameters.CODON_SIZE)]
-    histogram = {instr: 0 for instr in parameters.INSTRUCTIONS}
-    for codon in tape:
-        histogram[codon] += 1
-
+    histogram = Counter(tape if tape is not None else tokenize(code))
     total = sum(histogram.values())
     if total == 0:
         return 0.0
 
-    squared_sum = sum((count / total) ** 2 for count in histogram.values())
-    return -2.0 * float(math.log(math.sqrt(squared_sum), 64))
+    # -2 * log64(sqrt(x)) == -ln(x) / ln(64), without the sqrt or a per-call log(64)
+    squared_sum = sum(count * count for count in histogram.values()) / (total * total)
+    return -math.log(squared_sum) / _LOG_64
 
 def create_codon() -> str:
     """
@@ -52,7 +72,26 @@ def create_string() -> str:
         A random genetic code string.
     """
     str_size = random.randrange(parameters.MIN_GENE_SIZE, parameters.MID_GENE_SIZE)
-    return ''.join(create_codon() for _ in range(str_size))
+    return ''.join(random.choices(parameters.INSTRUCTIONS, k=str_size))
+
+def create_strings(count: int) -> List[str]:
+    """
+    Create several random genetic code strings at once.
+
+    Equivalent to calling create_string() count times, drawing from the
+    random module in the same order.
+
+    Args:
+        count: Number of strings to create.
+
+    Returns:
+        List of random genetic code strings.
+    """
+    choices = random.choices
+    randrange = random.randrange
+    instructions = parameters.INSTRUCTIONS
+    low, high = parameters.MIN_GENE_SIZE, parameters.MID_GENE_SIZE
+    return [''.join(choices(instructions, k=randrange(low, high))) for _ in range(count)]
 
 def mutate(code: str) -> str:
     """
@@ -77,23 +116,34 @@ def mutate(code: str) -> str:
     if not code:
         return code
 
-    tape = [code[i:i + parameters.CODON_SIZE] for i in range(0, len(code), parameters.CODON_SIZE)]
-    mutation_index = random.choice(range(10))  # 0-9, some are no-ops
-
-    if mutation_index == 0 and len(tape) + 1 <= parameters.MAX_GENE_SIZE:
-        tape.append(create_codon())  # Append
-    elif mutation_index == 1 and len(tape) + 1 <= parameters.MAX_GENE_SIZE:
-        tape.insert(0, create_codon())  # Prepend
-    elif mutation_index == 2 and len(tape) + 1 <= parameters.MAX_GENE_SIZE:
-        tape.insert(random.randrange(0, len(tape)), create_codon())  # Insert
-    elif mutation_index == 3 and tape:
-        tape[random.randrange(0, len(tape))] = create_codon()  # Rewrite
-    elif mutation_index == 4 and len(tape) > parameters.MIN_GENE_SIZE:
-        tape.pop(random.randrange(0, len(tape)))  # Remove
-    elif mutation_index == 5 and len(tape) >= 2:
-        idx1, idx2 = random.sample(range(len(tape)), 2)
-        tape[idx1], tape[idx2] = tape[idx2], tape[idx1]  # Swap
+    # Work on codon offsets in the string; only reverse needs the full tape
+    size = parameters.CODON_SIZE
+    count = -(-len(code) // size)
+    mutation_index = random.randrange(10)  # 0-9, some are no-ops
+
+    if mutation_index == 0 and count + 1 <= parameters.MAX_GENE_SIZE:
+        code = code + create_codon()  # Append
+    elif mutation_index == 1 and count + 1 <= parameters.MAX_GENE_SIZE:
+        code = create_codon() + code  # Prepend
+    elif mutation_index == 2 and count + 1 <= parameters.MAX_GENE_SIZE:
+        pos = random.randrange(0, count) * size
+        code = code[:pos] + create_codon() + code[pos:]  # Insert
+    elif mutation_index == 3:
+        codon = create_codon()
+        pos = random.randrange(0, count) * size
+        code = code[:pos] + codon + code[pos + size:]  # Rewrite
+    elif mutation_index == 4 and count > parameters.MIN_GENE_SIZE:
+        pos = random.randrange(0, count) * size
+        code = code[:pos] + code[pos + size:]  # Remove
+    elif mutation_index == 5 and count >= 2:
+        # Draw two distinct codon indices without building a range sample
+        first = random.randrange(count)
+        second = random.randrange(count - 1)
+        second += second >= first
+        a, b = min(first, second) * size, max(first, second) * size
+        code = (code[:a] + code[b:b + size] + code[a + size:b] +
+                code[a:a + size] + code[b + size:])  # Swap
     elif mutation_index == 6:
-        tape.reverse()  # Reverse
+        code = ''.join(reversed(tokenize(code)))  # Reverse
 
-    return ''.join(tape)
+    return code
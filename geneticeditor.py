@@ -2,7 +2,6 @@
 
 """Genetic Editor GUI for GeneticAlphabet2.2."""
 
-from PyQt5 import QtCore, QtGui, QtWidgets
 from interpreter import compile_code, decompile_code, tokenize_code
 from agent import Agent
 
@@ -13,6 +12,8 @@ class Ui_MainWindow(object):
         self.progeny = ""
 
     def setupUi(self, MainWindow):
+        # PyQt5 is imported only on GUI paths so importing this module stays cheap
+        from PyQt5 import QtCore, QtWidgets
         MainWindow.setObjectName("MainWindow")
         MainWindow.resize(800, 600)
         self.centralwidget = QtWidgets.QWidget(MainWindow)
@@ -37,6 +38,7 @@ class Ui_MainWindow(object):
         QtCore.QMetaObject.connectSlotsByName(MainWindow)
 
     def retranslateUi(self, MainWindow):
+        from PyQt5 import QtCore
         _translate = QtCore.QCoreApplication.translate
         MainWindow.setWindowTitle(_translate("MainWindow", "Genetic Editor"))
 
@@ -60,34 +62,42 @@ class Ui_MainWindow(object):
 
     def loadData(self):
         """Load code from compiledWindow into tableData."""
-        self.tableData.setRowCount(0)
-        code = self.compiledWindow.toPlainText()
-        tokens = tokenize_code(code)
-        if self.a.init(code):
-            self.tableData.setColumnCount(len(tokens))
-            self.tableData.insertRow(self.tableData.rowCount())
-            for col, token in enumerate(tokens):
-                self.tableData.setItem(0, col, QtWidgets.QTableWidgetItem(token))
-            self.statusbar.showMessage("Data Loaded!")
-        else:
-            self.statusbar.showMessage("Code not executable!")
+        self._loadTokensIntoTable(self.compiledWindow.toPlainText())
 
     def loadProgenyCode(self):
         """Load progeny code into tableData."""
-        self.tableData.setRowCount(0)
-        code = self.progeny
+        self._loadTokensIntoTable(self.progeny)
+
+    def _loadTokensIntoTable(self, code):
+        """Validate code with the agent and show its codons in tableData."""
+        if not self.a.init(code):
+            self.tableData.setRowCount(0)
+            self.statusbar.showMessage("Code not executable!")
+            return False
+        from PyQt5 import QtWidgets
         tokens = tokenize_code(code)
-        if self.a.init(code):
+        # Suspend repaints and signals so the fill costs a single repaint
+        self.tableData.setUpdatesEnabled(False)
+        self.tableData.blockSignals(True)
+        try:
             self.tableData.setColumnCount(len(tokens))
-            self.tableData.insertRow(self.tableData.rowCount())
+            self.tableData.setRowCount(1)
             for col, token in enumerate(tokens):
-                self.tableData.setItem(0, col, QtWidgets.QTableWidgetItem(token))
-            self.statusbar.showMessage("Data Loaded!")
-        else:
-            self.statusbar.showMessage("Code not executable!")
+                # Reuse existing cells and only touch those whose codon changed
+                item = self.tableData.item(0, col)
+                if item is None:
+                    self.tableData.setItem(0, col, QtWidgets.QTableWidgetItem(token))
+                elif item.text() != token:
+                    item.setText(token)
+        finally:
+            self.tableData.blockSignals(False)
+            self.tableData.setUpdatesEnabled(True)
+        self.statusbar.showMessage("Data Loaded!")
+        return True
 
 if __name__ == "__main__":
     import sys
+    from PyQt5 import QtWidgets
     app = QtWidgets.QApplication(sys.argv)
     MainWindow = QtWidgets.QMainWindow()
     ui = Ui_MainWindow()
@@ -2,11 +2,47 @@
 
 """Interpreter for executing genetic code interactively."""
 
+import functools
 import logging
 import os
+import re
 import parameters
+import genetic_strings
 from agent import Agent
-from typing import Optional
+from typing import Dict, FrozenSet, Optional, Tuple
+
+_CODON_SEQUENCE_RE = re.compile("[%s]{%d,}" % ("".join(sorted(parameters.VALID_NUCLEOTIDES)), parameters.CODON_SIZE))
+# Codon lookup tables, built once at import like the tables in agent and checks
+_CODON_TO_OP: Dict[str, str] = {codon: op for op, codons in parameters.OPERATIONS.items() for codon in codons}
+_OPERATION_CODONS: FrozenSet[str] = parameters.ALL_OP_CODONS
+
+@functools.lru_cache(maxsize=1024)
+def _compile_line(line: str) -> Tuple[str, Tuple[str, ...]]:
+    """
+    Compile a single line of high-level genetic code.
+
+    Args:
+        line: Line of high-level operation names or codons.
+
+    Returns:
+        Compiled code for the line and the invalid instructions it skipped.
+    """
+    parts = []
+    invalid = []
+    line = line.strip().upper()
+    if not line or line.startswith('#'):
+        return "", ()
+    operations = parameters.OPERATIONS
+    # Split space-separated operations
+    for op in line.split():
+        if op in operations:
+            parts.append(operations[op][0])
+        elif _CODON_SEQUENCE_RE.fullmatch(op):
+            # Codon sequences are copied through unchanged
+            parts.append(op)
+        else:
+            invalid.append(op)
+    return "".join(parts), tuple(invalid)
 
 def compile_code(lines: list) -> str:
     """
@@ -18,25 +54,16 @@ def compile_code(lines: list) -> str:
     Returns:
         Compiled genetic code as a string.
     """
-    compiled = ""
+    parts = []
     for line in lines:
-        line = line.strip().upper()
-        if not line or line.startswith('#'):
-            continue
-        # Split space-separated operations
-        operations = line.split()
-        for op in operations:
-            if op in parameters.OPERATIONS:
-                compiled += parameters.OPERATIONS[op][0]
-            elif len(op) >= parameters.CODON_SIZE and all(c in 'ATGCU' for c in op):
-                # Handle codon sequences
-                codons = [op[i:i + parameters.CODON_SIZE] 
-                          for i in range(0, len(op), parameters.CODON_SIZE)]
-                compiled += ''.join(codons)
-            else:
-                logging.warning("Skipping invalid instruction: %s", op)
-    return compiled
-
+        # Lines are memoized; warnings are still logged on every call
+        line_code, invalid = _compile_line(line)
+        for op in invalid:
+            logging.warning("Skipping invalid instruction: %s", op)
+        parts.append(line_code)
+    return "".join(parts)
+
+@functools.lru_cache(maxsize=1024)
 def decompile_code(code: str) -> str:
     """
     Decompile genetic code into high-level operations.
@@ -47,16 +74,7 @@ def decompile_code(code: str) -> str:
     Returns:
         Decompiled code as a string.
     """
-    tape = [code[i:i + parameters.CODON_SIZE] for i in range(0, len(code), parameters.CODON_SIZE)]
-    decompiled = []
-    for codon in tape:
-        for op, codons in parameters.OPERATIONS.items():
-            if codon in codons:
-                decompiled.append(op)
-                break
-        else:
-            decompiled.append(codon)
-    return " ".join(decompiled)
+    return " ".join([_CODON_TO_OP.get(codon, codon) for codon in tokenize_code(code)])
 
 def tokenize_code(execution_string: str) -> list:
     """
@@ -68,9 +86,14 @@ def tokenize_code(execution_string: str) -> list:
     Returns:
         List of codons.
     """
-    return [execution_string[i:i + parameters.CODON_SIZE] 
-            for i in range(0, len(execution_string), parameters.CODON_SIZE)]
+    return list(_tokenize_cached(execution_string))
+
+@functools.lru_cache(maxsize=1024)
+def _tokenize_cached(execution_string: str) -> Tuple[str, ...]:
+    """Memoized, immutable tokenization backing tokenize_code."""
+    return tuple(genetic_strings.tokenize(execution_string))
 
+@functools.lru_cache(maxsize=1024)
 def compress_code(execution_string: str) -> str:
     """
     Compress genetic code by keeping only operational codons.
@@ -81,10 +104,14 @@ def compress_code(execution_string: str) -> str:
     Returns:
         Compressed genetic code string.
     """
-    tape = [execution_string[i:i + parameters.CODON_SIZE] 
-            for i in range(0, len(execution_string), parameters.CODON_SIZE)]
-    compressed = [codon for codon in tape if any(codon in codons for op, codons in parameters.OPERATIONS.items())]
-    return "".join(compressed)
+    return "".join([codon for codon in tokenize_code(execution_string) if codon in _OPERATION_CODONS])
+
+def clear_compile_cache() -> None:
+    """Clear memoized compile, decompile, tokenize and compress results."""
+    _compile_line.cache_clear()
+    decompile_code.cache_clear()
+    _tokenize_cached.cache_clear()
+    compress_code.cache_clear()
 
 def run_interpreter(input_file: Optional[str] = None, verbose: bool = False) -> None:
     """
@@ -116,6 +143,7 @@ def run_interpreter(input_file: Optional[str] = None, verbose: bool = False) ->
             command = input("> ").strip()
 
         if command.lower() == "quit":
+            clear_compile_cache()
             logging.info("Exiting interpreter")
             break
 
@@ -145,10 +173,13 @@ def run_interpreter(input_file: Optional[str] = None, verbose: bool = False) ->
                 logging.debug("Running code: %s", code)
                 if agent.init(code):
                     try:
-                        while not agent.iteration():
-                            if parameters.DYNAMIC_MODE:
+                        if parameters.DYNAMIC_MODE and logging.root.isEnabledFor(logging.DEBUG):
+                            # Step codon by codon to trace every intermediate state
+                            while not agent.iteration():
                                 logging.debug("Progeny code: %s, PC: %d", 
                                              agent.progeny_code, agent.program_counter)
+                        else:
+                            agent.run_to_completion()
                         logging.info("Execution complete. Progeny code: %s", agent.progeny_code)
                         print(f"Progeny code: {agent.progeny_code}")
                     except Exception as e:
@@ -3,15 +3,29 @@
 """Main entry point for GeneticAlphabet2.2 framework."""
 
 import argparse
+import concurrent.futures
+import contextlib
 import logging
+import logging.handlers
 import os
+import random
+import re
 import sys
-from typing import Optional, List
+from typing import Any, Dict, Optional, List, Tuple
 import parameters
 from interpreter import run_interpreter, compile_code
 from simulation import Simulation
 import cross_reference
 
+_LOG_FORMAT = "%(asctime)s %(levelname)s %(message)s"
+_LOG_BUFFER_CAPACITY = 8192
+
+# Simulation arguments shared by every run in a worker process
+_worker_sim_kwargs: Dict[str, Any] = {}
+
+# A line of whole codons; operation codons are nucleotide triples too
+_CODE_RE = re.compile("(?:[%s]{%d})+" % ("".join(sorted(parameters.VALID_NUCLEOTIDES)), parameters.CODON_SIZE))
+
 def load_input_file(filepath: str, should_compile: bool = True) -> List[str]:
     """
     Load genetic codes from an input file.
@@ -27,8 +41,10 @@ def load_input_file(filepath: str, should_compile: bool = True) -> List[str]:
         logging.error("Input file does not exist: %s", filepath)
         return []
     
+    # Read the file in one call; newlines are already normalized to '\n' in text mode
     with open(filepath, 'r') as f:
-        lines = [line.strip() for line in f if line.strip() and not line.startswith('#')]
+        raw_lines = f.read().split('\n')
+    lines = [line.strip() for line in raw_lines if line.strip() and not line.startswith('#')]
     
     if should_compile:
         compiled_codes = []
@@ -37,12 +53,8 @@ def load_input_file(filepath: str, should_compile: bool = True) -> List[str]:
             if code in parameters.OPERATIONS:
                 compiled_codes.append(parameters.OPERATIONS[code][0])
             else:
-                # Split into codons and compile if necessary
-                codons = [code[i:i + parameters.CODON_SIZE] 
-                          for i in range(0, len(code), parameters.CODON_SIZE)]
-                if all(codon in sum(parameters.OPERATIONS.values(), []) or 
-                       (len(codon) == parameters.CODON_SIZE and all(c in 'ATGCU' for c in codon)) 
-                       for codon in codons):
+                # Raw codon strings pass through; anything else is compiled
+                if _CODE_RE.fullmatch(code):
                     compiled_codes.append(code)
                 else:
                     # Treat as high-level ops
@@ -50,6 +62,26 @@ def load_input_file(filepath: str, should_compile: bool = True) -> List[str]:
         return compiled_codes
     return lines
 
+def _format_result(run_number: int, best_agent: Optional['Agent'], generation: int, fitness: float) -> str:
+    """
+    Format the result line of a simulation run for the output file.
+
+    Args:
+        run_number: Current simulation run number.
+        best_agent: Best agent from the simulation.
+        generation: Generation the simulation stopped at.
+        fitness: Fitness of best_agent.
+
+    Returns:
+        The result line, including its trailing newline.
+    """
+    if best_agent:
+        return (f"Run {run_number}, Generation {generation}, "
+                f"Best Agent (family_id={best_agent.family_id}), "
+                f"Fitness: {fitness:.3f}, Code: {best_agent.code}, "
+                f"Progeny Code: {best_agent.progeny_code}\n")
+    return f"Run {run_number}: No valid agents\n"
+
 def write_output_file(filepath: str, run_number: int, best_agent: Optional['Agent'], sim: 'Simulation') -> None:
     """
     Write simulation results to an output file.
@@ -60,22 +92,76 @@ def write_output_file(filepath: str, run_number: int, best_agent: Optional['Agen
         best_agent: Best agent from the simulation.
         sim: Simulation instance.
     """
+    fitness = sim.evaluate_fitness(best_agent) if best_agent else 0.0
     with open(filepath, 'a') as f:
-        if best_agent:
-            fitness = sim.evaluate_fitness(best_agent)
-            f.write(f"Run {run_number}, Generation {sim.generation}, "
-                    f"Best Agent (family_id={best_agent.family_id}), "
-                    f"Fitness: {fitness:.3f}, Code: {best_agent.code}, "
-                    f"Progeny Code: {best_agent.progeny_code}\n")
-        else:
-            f.write(f"Run {run_number}: No valid agents\n")
+        f.write(_format_result(run_number, best_agent, sim.generation, fitness))
+
+def _init_worker(verbose: bool, log_level: int, log_file: Optional[str],
+                 sim_kwargs: Dict[str, Any]) -> None:
+    """
+    Configure a worker process for simulation runs.
+
+    The Simulation arguments are shared by every run, so they are sent once
+    per worker here rather than pickled with each task.
+
+    Workers started by fork inherit the parent's logging setup; workers
+    started by spawn or forkserver log to the same file at the same level.
+    Workers exit without flushing memory buffers, so an inherited
+    MemoryHandler is replaced by its target and records are written directly.
+
+    Args:
+        verbose: If True, enable DYNAMIC_MODE for detailed output.
+        log_level: Level of the parent's root logger.
+        log_file: Path of the parent's log file, if it logs to one.
+        sim_kwargs: Keyword arguments for Simulation.
+    """
+    global _worker_sim_kwargs
+    _worker_sim_kwargs = sim_kwargs
+    parameters.DYNAMIC_MODE = verbose
+    for handler in list(logging.root.handlers):
+        if isinstance(handler, logging.handlers.MemoryHandler):
+            logging.root.removeHandler(handler)
+            if handler.target is not None:
+                logging.root.addHandler(handler.target)
+    if log_file and not logging.root.handlers:
+        logging.basicConfig(filename=log_file, level=log_level, format=_LOG_FORMAT)
+
+def _run_one(run_number: int, seed: Optional[int], max_runs: int,
+             sim_kwargs: Dict[str, Any]) -> Tuple[Optional['Agent'], int, float]:
+    """
+    Run a single simulation.
+
+    Args:
+        run_number: Current simulation run number.
+        seed: Optional seed for this run's random number generator.
+        max_runs: Total number of simulation runs, for logging.
+        sim_kwargs: Keyword arguments for Simulation.
+
+    Returns:
+        Tuple of (best agent or None, final generation, best agent fitness).
+    """
+    if seed is not None:
+        random.seed(seed)
+    logging.info("Running simulation %d/%d...", run_number, max_runs)
+    sim = Simulation(**sim_kwargs)
+    best_agent = sim.run_simulation()
+    fitness = sim.evaluate_fitness(best_agent) if best_agent else 0.0
+    return best_agent, sim.generation, fitness
+
+def _run_in_worker(run_number: int, seed: Optional[int], max_runs: int) -> Tuple[Optional['Agent'], int, float]:
+    """Run a single simulation in a worker set up by _init_worker."""
+    return _run_one(run_number, seed, max_runs, _worker_sim_kwargs)
 
 def run_simulation(population_size: int, generations: int, max_steps: int, max_runs: int, 
                    input_file: Optional[str], output_file: Optional[str], verbose: bool, 
-                   should_compile: bool = True, target_peptide: Optional[str] = None) -> None:
+                   should_compile: bool = True, target_peptide: Optional[str] = None,
+                   elite_count: int = 1, patience: Optional[int] = 20) -> None:
     """
     Run genetic simulations with the specified parameters.
 
+    Independent runs are spread across worker processes when max_runs > 1;
+    results are still logged and written in run order.
+
     Args:
         population_size: Number of agents in the population.
         generations: Number of generations per run.
@@ -86,6 +172,9 @@ def run_simulation(population_size: int, generations: int, max_steps: int, max_r
         verbose: If True, enable DYNAMIC_MODE for detailed output.
         should_compile: If True, compile input file codes before use.
         target_peptide: Optional target peptide sequence to search for.
+        elite_count: Number of fittest agents carried into each new generation.
+        patience: Stop a run early after this many generations without
+            improvement; None or 0 runs every generation (default: 20).
     """
     parameters.DYNAMIC_MODE = verbose
     population_size = min(population_size, parameters.MAX_PROGENY)
@@ -99,26 +188,46 @@ def run_simulation(population_size: int, generations: int, max_steps: int, max_r
         logging.info("Loading initial codes from %s%s", input_file, " with compilation" if should_compile else "")
         initial_codes = load_input_file(input_file, should_compile=should_compile)
 
-    for run in range(1, max_runs + 1):
-        logging.info("Running simulation %d/%d...", run, max_runs)
-        sim = Simulation(population_size=population_size, max_generations=generations, 
-                         max_steps=max_steps, initial_codes=initial_codes, max_attempts=100,
-                         target_peptide=target_peptide)
-        best_agent = sim.run_simulation()
-
-        # Log results
-        if best_agent:
-            logging.info("Run %d completed after %d generations", run, sim.generation)
-            logging.info("Best agent (family_id=%d):", best_agent.family_id)
-            logging.info("  Code: %s", best_agent.code)
-            logging.info("  Progeny code: %s", best_agent.progeny_code)
-            logging.info("  Fitness: %.3f", sim.evaluate_fitness(best_agent))
+    sim_kwargs = dict(population_size=population_size, max_generations=generations, 
+                      max_steps=max_steps, initial_codes=initial_codes, max_attempts=100,
+                      target_peptide=target_peptide, elite_count=elite_count,
+                      patience=patience)
+    runs = range(1, max_runs + 1)
+
+    with contextlib.ExitStack() as stack:
+        # Open the output file once and append every run's result to it
+        out = stack.enter_context(open(output_file, 'a')) if output_file else None
+
+        if max_runs == 1:
+            results = [_run_one(1, None, max_runs, sim_kwargs)]
         else:
-            logging.warning("Run %d failed: No agents in population", run)
+            # Seed each worker from the parent RNG so seeded callers stay reproducible
+            seeds = [random.getrandbits(64) for _ in runs]
+            # Flush buffered records so forked workers do not inherit them
+            for handler in logging.root.handlers:
+                handler.flush()
+            file_handlers = (getattr(handler, 'target', None) or handler for handler in logging.root.handlers)
+            log_file = next((handler.baseFilename for handler in file_handlers
+                             if isinstance(handler, logging.FileHandler)), None)
+            executor = stack.enter_context(concurrent.futures.ProcessPoolExecutor(
+                max_workers=min(max_runs, os.cpu_count() or 1), initializer=_init_worker,
+                initargs=(verbose, logging.root.level, log_file, sim_kwargs)))
+            results = executor.map(_run_in_worker, runs, seeds, [max_runs] * max_runs)
+
+        for run, (best_agent, generation, fitness) in zip(runs, results):
+            # Log results
+            if best_agent:
+                logging.info("Run %d completed after %d generations", run, generation)
+                logging.info("Best agent (family_id=%d):", best_agent.family_id)
+                logging.info("  Code: %s", best_agent.code)
+                logging.info("  Progeny code: %s", best_agent.progeny_code)
+                logging.info("  Fitness: %.3f", fitness)
+            else:
+                logging.warning("Run %d failed: No agents in population", run)
 
-        # Write to output file if specified
-        if output_file:
-            write_output_file(output_file, run, best_agent, sim)
+            # Write to output file if specified
+            if out is not None:
+                out.write(_format_result(run, best_agent, generation, fitness))
 
 def main():
     """Main function to parse arguments and run the framework."""
@@ -132,7 +241,8 @@ def main():
     parser.add_argument("--population-size", type=int, default=10, 
                         help="Population size for simulation")
     parser.add_argument("--generations", type=int, default=100, 
-                        help="Number of generations for simulation")
+                        help="Maximum number of generations for simulation; runs stop "
+                             "earlier once fitness plateaus (see --patience)")
     parser.add_argument("--max-steps", type=int, default=100, 
                         help="Maximum execution steps per agent")
     parser.add_argument("--max-runs", type=int, default=1, 
@@ -144,17 +254,29 @@ def main():
     parser.add_argument("--compile", action="store_true", 
                         help="Compile input file codes before simulation")
     parser.add_argument("--target-peptide", type=str, help="Target peptide sequence to search for")
+    parser.add_argument("--elite-count", type=int, default=1, 
+                        help="Fittest agents carried unchanged into each generation (0 disables elitism)")
+    parser.add_argument("--patience", type=int, default=20, 
+                        help="Stop after this many generations without fitness improvement "
+                             "(0 disables early stopping)")
 
     args = parser.parse_args()
+    if args.patience < 0:
+        parser.error("--patience must be 0 or greater")
 
-    # Setup logging
-    logging.basicConfig(filename=args.log_file, level=logging.DEBUG if args.verbose else logging.INFO,
-                        format="%(asctime)s %(levelname)s %(message)s")
+    # Setup logging; records are buffered in memory and written in batches,
+    # flushing immediately on errors and at interpreter exit
+    file_handler = logging.FileHandler(args.log_file)
+    file_handler.setFormatter(logging.Formatter(_LOG_FORMAT))
+    memory_handler = logging.handlers.MemoryHandler(capacity=_LOG_BUFFER_CAPACITY, flushLevel=logging.ERROR,
+                                                    target=file_handler)
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.INFO, handlers=[memory_handler])
 
     if args.mode == "simulation":
         run_simulation(args.population_size, args.generations, args.max_steps, 
                        args.max_runs, args.input_file, args.output_file, 
-                       args.verbose, args.compile, args.target_peptide)
+                       args.verbose, args.compile, args.target_peptide,
+                       elite_count=args.elite_count, patience=args.patience)
     elif args.mode == "interpreter":
         run_interpreter(args.input_file, args.verbose)
     elif args.mode == "cross-reference":
@@ -168,7 +290,9 @@ def main():
             num_random=args.num_random,
             initial_codes=initial_codes,
             output_prefix="cross_reference",
-            target_peptide=args.target_peptide
+            target_peptide=args.target_peptide,
+            elite_count=args.elite_count,
+            patience=args.patience
         )
 
 if __name__ == "__main__":
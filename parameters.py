@@ -2,7 +2,8 @@
 
 """Global configuration parameters for the genetic simulation."""
 
-from typing import Dict, List, Set
+from typing import Dict, FrozenSet, List, Set
+import os
 import sys
 
 # Simulation limits
@@ -52,8 +53,14 @@ OPERATIONS: Dict[str, List[str]] = {
 """Dictionary mapping operation names to their corresponding codons."""
 
 # Derived sets for efficient lookups
-NO_OPS: Set[str] = set(INSTRUCTIONS) - set(sum(OPERATIONS.values(), []))
-"""Set of codons that do not correspond to any operation."""
+VALID_NUCLEOTIDES: FrozenSet[str] = frozenset("ATGCU")
+"""Frozenset of characters allowed in a genetic code string."""
+ALL_OP_CODONS: FrozenSet[str] = frozenset(codon for codons in OPERATIONS.values() for codon in codons)
+"""Frozenset of every codon assigned to an operation."""
+NO_OPS: FrozenSet[str] = frozenset(INSTRUCTIONS) - ALL_OP_CODONS
+"""Frozenset of codons that do not correspond to any operation."""
+OPERATION_SETS: Dict[str, FrozenSet[str]] = {op: frozenset(codons) for op, codons in OPERATIONS.items()}
+"""Frozenset view of OPERATIONS for O(1) codon membership tests."""
 
 # Validation
 def validate_parameters() -> None:
@@ -72,7 +79,7 @@ def validate_parameters() -> None:
         raise ValueError("Duplicate codons found in INSTRUCTIONS")
 
     # Check all operation codons are valid
-    all_op_codons = set(sum(OPERATIONS.values(), []))
+    all_op_codons = {codon for codons in OPERATIONS.values() for codon in codons}
     invalid_ops = all_op_codons - set(INSTRUCTIONS)
     if invalid_ops:
         raise ValueError(
@@ -93,8 +100,17 @@ def validate_parameters() -> None:
     if NO_OPS != expected_no_ops:
         raise ValueError("NO_OPS does not match expected non-operational codons")
 
-# Run validation on module import
-validate_parameters()
+    # Check ALL_OP_CODONS
+    if ALL_OP_CODONS != all_op_codons:
+        raise ValueError("ALL_OP_CODONS does not match OPERATIONS")
+
+    # Check OPERATION_SETS
+    if OPERATION_SETS != {op: frozenset(codons) for op, codons in OPERATIONS.items()}:
+        raise ValueError("OPERATION_SETS does not match OPERATIONS")
+
+# Run validation on module import unless explicitly skipped
+if os.environ.get("GENETIC_SKIP_VALIDATE") != "1":
+    validate_parameters()
 
 if __name__ == "__main__":
     print("Configuration parameters for genetic simulation:")
@@ -2,17 +2,23 @@
 
 """Simulation for evolving a population of genetic agents."""
 
+import heapq
+import itertools
 import random
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 import logging
 import parameters
 import genetic_strings
-from agent import Agent
+from agent import Agent, evaluate_population
+
+# Fitness cache entries kept per member of the population
+_FITNESS_CACHE_FACTOR = 10
 
 class Simulation:
     def __init__(self, population_size: int, max_generations: int, max_steps: int, 
                  initial_codes: Optional[List[str]] = None, max_attempts: int = 100,
-                 target_peptide: Optional[str] = None):
+                 target_peptide: Optional[str] = None, elite_count: int = 1,
+                 patience: Optional[int] = 20, tol: float = 1e-6):
         """
         Initialize the simulation with a population of agents.
 
@@ -23,13 +29,30 @@ class Simulation:
             initial_codes: Optional list of initial genetic codes.
             max_attempts: Maximum attempts to initialize random agents (default: 100).
             target_peptide: Optional target peptide sequence to search for.
+            elite_count: Number of fittest agents carried unchanged into each
+                new generation, capped at population_size - 1 (default: 1).
+            patience: Stop early after this many generations without the best
+                fitness improving by more than tol; None or 0 runs every
+                generation (default: 20).
+            tol: Minimum best-fitness gain that counts as an improvement.
         """
         self.population_size = min(population_size, parameters.MAX_PROGENY)
         self.max_generations = min(max_generations, parameters.MAX_ITERATIONS)
         self.max_steps = min(max_steps, parameters.MAX_ITERATIONS)
         self.target_peptide = target_peptide
+        # Leave at least one offspring slot so the population keeps evolving
+        self.elite_count = max(0, min(elite_count, self.population_size - 1))
+        # Non-positive patience would stop after a single stale generation
+        self.patience = patience if patience is not None and patience > 0 else None
+        self.tol = tol
         self.generation = 0
         self.population: List[Agent] = []
+        # Fitness by progeny code, kept across generations; target_peptide is
+        # fixed per simulation, so progeny code alone determines fitness
+        self._fitness_cache: Dict[str, float] = {}
+        self._fitness_cache_size = _FITNESS_CACHE_FACTOR * max(self.population_size, 1)
+        # Agents retired from earlier generations, reused instead of reallocated
+        self._agent_pool: List[Agent] = []
 
         if initial_codes:
             for i, code in enumerate(initial_codes[:self.population_size]):
@@ -39,16 +62,17 @@ class Simulation:
                 else:
                     logging.warning("Failed to initialize agent with code: %s", code)
 
-        # Try to fill remaining population with random codes
+        # Try to fill remaining population with random codes, drawn in batches
         attempts = 0
         while len(self.population) < self.population_size and attempts < max_attempts:
-            code = genetic_strings.create_string()
-            agent = Agent(family_id=len(self.population))
-            if agent.init(code):
-                self.population.append(agent)
-            else:
-                logging.warning("Failed to initialize agent with random code")
-            attempts += 1
+            batch = min(self.population_size - len(self.population), max_attempts - attempts)
+            for code in genetic_strings.create_strings(batch):
+                agent = Agent(family_id=len(self.population))
+                if agent.init(code):
+                    self.population.append(agent)
+                else:
+                    logging.warning("Failed to initialize agent with random code")
+            attempts += batch
 
         if not self.population:
             logging.error("Failed to initialize any agents after %d attempts", max_attempts)
@@ -64,27 +88,97 @@ class Simulation:
         Returns:
             The fitness score.
         """
-        fitness = agent.evaluate_fitness(target_peptide=self.target_peptide)
-        if parameters.DYNAMIC_MODE:
-            logging.debug("Agent (family_id=%d) fitness: %.3f (code: %s, progeny: %s, peptide: %s)", 
-                          agent.family_id, fitness, agent.code, agent.progeny_code, 
-                          agent.translate_to_peptide())
+        fitness = self._fitness_cache.get(agent.progeny_code)
+        if fitness is None:
+            fitness = agent.evaluate_fitness(target_peptide=self.target_peptide)
+            self._fitness_cache[agent.progeny_code] = fitness
+            if parameters.DYNAMIC_MODE and logging.root.isEnabledFor(logging.DEBUG):
+                logging.debug("Agent (family_id=%d) fitness: %.3f (code: %s, progeny: %s, peptide: %s)", 
+                              agent.family_id, fitness, agent.code, agent.progeny_code, 
+                              agent.translate_to_peptide())
         return fitness
 
-    def select_parents(self) -> List[Agent]:
+    def _trim_fitness_cache(self) -> None:
+        """Evict the oldest fitness cache entries beyond the size bound."""
+        cache = self._fitness_cache
+        excess = len(cache) - self._fitness_cache_size
+        if excess > 0:
+            # Dicts keep insertion order, so the first keys are the oldest
+            for key in list(itertools.islice(cache, excess)):
+                del cache[key]
+
+    def _population_fitness(self) -> List[float]:
+        """
+        Evaluate the fitness of every agent in the current population.
+
+        Returns:
+            Fitness scores in population order, served from the fitness cache
+            where possible.
+        """
+        fitnesses = evaluate_population(self.population, target_peptide=self.target_peptide,
+                                        scores=self._fitness_cache)
+        if parameters.DYNAMIC_MODE and logging.root.isEnabledFor(logging.DEBUG):
+            for agent, fitness in zip(self.population, fitnesses):
+                logging.debug("Agent (family_id=%d) fitness: %.3f (code: %s, progeny: %s, peptide: %s)", 
+                              agent.family_id, fitness, agent.code, agent.progeny_code, 
+                              agent.translate_to_peptide())
+        return fitnesses
+
+    def _best_agent(self, fitnesses: Optional[List[float]] = None) -> Tuple[Optional[Agent], float]:
+        """
+        Find the fittest agent in the current population.
+
+        Args:
+            fitnesses: Optional precomputed fitness scores in population order.
+
+        Returns:
+            Tuple of (first agent with the highest fitness, its fitness), or
+            (None, 0.0) if the population is empty.
+        """
+        if fitnesses is None:
+            fitnesses = self._population_fitness()
+        best = max(range(len(fitnesses)), key=fitnesses.__getitem__, default=None)
+        if best is None:
+            return None, 0.0
+        return self.population[best], fitnesses[best]
+
+    def select_parents(self, fitnesses: Optional[List[float]] = None) -> List[Agent]:
         """
         Select parents for the next generation using tournament selection.
 
+        Args:
+            fitnesses: Optional precomputed fitness scores in population order.
+
         Returns:
             List of selected parent agents.
         """
+        if not self.population:
+            return []
         tournament_size = min(3, len(self.population))
+        if fitnesses is None:
+            fitnesses = self._population_fitness()
+
+        # Each tournament draws distinct contestants with a partial Fisher-Yates
+        # shuffle of one reused index list; any order of the list is a valid
+        # starting point, so it is never reset between tournaments
+        population = self.population
+        size = len(population)
+        indices = list(range(size))
+        randrange = random.randrange
         parents = []
         for _ in range(self.population_size):
-            tournament = random.sample(self.population, tournament_size)
-            best = max(tournament, key=self.evaluate_fitness, default=None)
-            if best:
-                parents.append(best)
+            best = -1
+            best_fitness = 0.0
+            for k in range(tournament_size):
+                j = randrange(k, size)
+                contestant = indices[j]
+                indices[j] = indices[k]
+                indices[k] = contestant
+                # Ties keep the first contestant drawn, as max() did
+                if best < 0 or fitnesses[contestant] > best_fitness:
+                    best = contestant
+                    best_fitness = fitnesses[contestant]
+            parents.append(population[best])
         return parents
 
     def run_simulation(self) -> Optional[Agent]:
@@ -98,63 +192,103 @@ class Simulation:
             logging.error("Cannot run simulation: Empty population")
             return None
 
+        # Check the log level once so disabled debug output costs nothing per agent
+        debug_enabled = logging.root.isEnabledFor(logging.DEBUG)
+        debug = parameters.DYNAMIC_MODE and debug_enabled
+
         # Initial iteration for first generation (no mutation)
         for agent in self.population:
-            for _ in range(self.max_steps):
-                if agent.iteration():
-                    break
-            logging.debug("Initial agent (family_id=%d) progeny_code: %s, peptide: %s", 
-                          agent.family_id, agent.progeny_code, agent.translate_to_peptide())
+            agent.run_to_completion(self.max_steps)
+            if debug_enabled:
+                logging.debug("Initial agent (family_id=%d) progeny_code: %s, peptide: %s", 
+                              agent.family_id, agent.progeny_code, agent.translate_to_peptide())
 
+        # Score each generation once; selection, elitism, logging and the
+        # plateau check all share the same scores
+        fitnesses = self._population_fitness()
+        best_so_far = float("-inf")
+        stale_generations = 0
         for gen in range(self.max_generations):
             self.generation = gen + 1
-            if parameters.DYNAMIC_MODE:
+            if debug:
                 logging.debug("Generation %d/%d", self.generation, self.max_generations)
 
             # Evaluate and select parents
-            parents = self.select_parents()
+            parents = self.select_parents(fitnesses)
             if not parents:
                 logging.warning("No parents selected for generation %d", self.generation)
                 break
 
-            # Create new population with mutations
-            new_population = []
-            for i in range(self.population_size):
-                parent = random.choice(parents)
+            # Carry the elite over unchanged; they are already run and scored
+            elites = heapq.nlargest(self.elite_count, range(len(self.population)),
+                                    key=fitnesses.__getitem__)
+            elite_agents = [self.population[index] for index in elites]
+            for i, agent in enumerate(elite_agents):
+                agent.family_id = i
+            new_population = list(elite_agents)
+
+            # Fill the rest of the new population with mutated offspring
+            pool = self._agent_pool
+            offspring = self.population_size - len(new_population)
+            chosen = random.choices(parents, k=offspring)
+            for i, parent in enumerate(chosen, start=len(new_population)):
                 # Only mutate in later generations to preserve initial codes
                 code = genetic_strings.mutate(parent.code) if gen > 0 else parent.code
-                agent = Agent(family_id=i)
+                if pool:
+                    agent = pool.pop()
+                    agent.reset(family_id=i)
+                else:
+                    agent = Agent(family_id=i)
                 if agent.init(code):
                     # Run iterations for new agent
-                    for _ in range(self.max_steps):
-                        if agent.iteration():
-                            break
+                    agent.run_to_completion(self.max_steps)
                     new_population.append(agent)
-                    if parameters.DYNAMIC_MODE:
+                    if debug:
                         logging.debug("New agent (family_id=%d) code: %s, progeny_code: %s, peptide: %s", 
                                       i, code, agent.progeny_code, agent.translate_to_peptide())
                 else:
                     logging.warning("Failed to initialize new agent with code: %s", code)
+                    pool.append(agent)
 
-            self.population = new_population if new_population else self.population
+            if new_population:
+                # The outgoing generation is no longer needed as parents
+                carried = {id(agent) for agent in elite_agents}
+                pool.extend(agent for agent in self.population if id(agent) not in carried)
+                self.population = new_population
+                fitnesses = self._population_fitness()
+                self._trim_fitness_cache()
 
             # Check for convergence or empty population
             if not self.population:
                 logging.error("Population extinct at generation %d", self.generation)
                 return None
 
-            # Log generation summary
-            best_agent = max(self.population, key=self.evaluate_fitness, default=None)
-            if best_agent and parameters.DYNAMIC_MODE:
-                logging.debug("Best fitness in generation %d: %.3f (progeny_code: %s, peptide: %s)", 
-                              self.generation, self.evaluate_fitness(best_agent), 
-                              best_agent.progeny_code, best_agent.translate_to_peptide())
+            # Log generation summary; the best agent is only needed for the log
+            if debug:
+                best_agent, best_fitness = self._best_agent(fitnesses)
+                if best_agent:
+                    logging.debug("Best fitness in generation %d: %.3f (progeny_code: %s, peptide: %s)", 
+                                  self.generation, best_fitness, 
+                                  best_agent.progeny_code, best_agent.translate_to_peptide())
+
+            # Stop once the best fitness has plateaued
+            if self.patience is not None:
+                best_fitness = max(fitnesses)
+                if best_fitness > best_so_far + self.tol:
+                    best_so_far = best_fitness
+                    stale_generations = 0
+                else:
+                    stale_generations += 1
+                    if stale_generations >= self.patience:
+                        logging.info("Converged at generation %d: best fitness %.3f unchanged for %d generations",
+                                     self.generation, best_fitness, stale_generations)
+                        break
 
         # Return the best agent
-        best_agent = max(self.population, key=self.evaluate_fitness, default=None)
+        best_agent, best_fitness = self._best_agent(fitnesses)
         if best_agent:
             logging.info("Simulation completed. Best agent (family_id=%d) fitness: %.3f, progeny_code: %s, peptide: %s", 
-                         best_agent.family_id, self.evaluate_fitness(best_agent), 
+                         best_agent.family_id, best_fitness, 
                          best_agent.progeny_code, best_agent.translate_to_peptide())
         else:
             logging.warning("No best agent found")
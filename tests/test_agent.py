@@ -7,8 +7,9 @@ import os
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 import unittest
+import logging
 from unittest.mock import patch
-from agent import Agent
+from agent import Agent, evaluate_population
 import parameters
 import genetic_strings
 
@@ -24,6 +25,14 @@ class TestAgent(unittest.TestCase):
         self.assertEqual(self.agent.code, "AAAAAA")
         self.assertEqual(self.agent.tape, ["AAA", "AAA"])
 
+    def test_init_same_code_separate_tapes(self):
+        """Test agents sharing a code get independent tapes."""
+        other = Agent(family_id=1)
+        self.assertTrue(self.agent.init("UUUCCC"))
+        self.assertTrue(other.init("UUUCCC"))
+        self.assertEqual(self.agent.tape, other.tape)
+        self.assertIsNot(self.agent.tape, other.tape)
+
     def test_init_invalid_code(self):
         """Test initialization with invalid code."""
         with self.assertLogs(level='ERROR') as cm:
@@ -56,6 +65,75 @@ class TestAgent(unittest.TestCase):
         self.assertEqual(self.agent.progeny_code, "UUU")
         self.assertTrue(self.agent.iteration())  # End of code
 
+    def test_iteration_stop(self):
+        """Test every STOP codon halts execution without copying."""
+        for stop_codon in parameters.OPERATIONS["STOP"]:
+            self.agent.init("UUU" + stop_codon + "UUU")
+            self.assertFalse(self.agent.iteration())  # Data codon
+            self.assertTrue(self.agent.iteration())  # STOP
+            self.assertEqual(self.agent.progeny_code, "UUU")
+
+    def test_iteration_appends_to_initial_progeny(self):
+        """Test iteration appends codons after an initial progeny code."""
+        self.agent.init("UUU", progeny_code="AAG")
+        self.assertFalse(self.agent.iteration())
+        self.assertEqual(self.agent.progeny_code, "AAGUUU")
+        self.agent.progeny_code = ""
+        self.assertEqual(self.agent.progeny_code, "")
+
+    def test_iteration_skips_disabled_debug_logging(self):
+        """Test iteration makes no debug calls when DEBUG is disabled."""
+        level = logging.root.level
+        logging.root.setLevel(logging.INFO)
+        self.addCleanup(logging.root.setLevel, level)
+        self.agent.init("AAAUUUAAG" + parameters.OPERATIONS["STOP"][0])
+        with patch('logging.debug') as mocked_debug:
+            while not self.agent.iteration():
+                pass
+            mocked_debug.assert_not_called()
+
+    def test_run_to_completion_matches_iteration(self):
+        """Test run_to_completion produces the same state as iteration."""
+        code = "UUUAAGAAAGGG" + parameters.OPERATIONS["STOP"][0] + "CCC"
+        stepped = Agent(family_id=1)
+        stepped.init(code)
+        while not stepped.iteration():
+            pass
+        self.agent.init(code)
+        self.assertTrue(self.agent.run_to_completion())
+        self.assertEqual(self.agent.progeny_code, stepped.progeny_code)
+        self.assertEqual(self.agent.program_counter, stepped.program_counter)
+        self.assertEqual(self.agent.eip_ptr, stepped.eip_ptr)
+
+    def test_run_to_completion_max_steps(self):
+        """Test run_to_completion stops after max_steps codons."""
+        self.agent.init("UUUCCCGGG")
+        self.assertFalse(self.agent.run_to_completion(max_steps=2))
+        self.assertEqual(self.agent.progeny_code, "UUUCCC")
+        self.assertTrue(self.agent.run_to_completion(max_steps=2))
+        self.assertEqual(self.agent.progeny_code, "UUUCCCGGG")
+
+    def test_reset_reuses_progeny_buffer(self):
+        """Test reset clears progeny_code without replacing its buffer."""
+        self.agent.init("UUUCCC")
+        self.agent.run_to_completion()
+        buffer = self.agent._progeny_parts
+        self.agent.reset()
+        self.assertEqual(self.agent.progeny_code, "")
+        self.agent.init("GGG")
+        self.agent.run_to_completion()
+        self.assertIs(self.agent._progeny_parts, buffer)
+        self.assertEqual(self.agent.progeny_code, "GGG")
+
+    def test_reset_family_id(self):
+        """Test reset can move the agent to a new family ID."""
+        self.agent.init("UUUCCC")
+        self.agent.reset(family_id=5)
+        self.assertEqual(self.agent.family_id, 5)
+        self.assertEqual(self.agent.code, "")
+        self.agent.reset()
+        self.assertEqual(self.agent.family_id, 5)
+
     def test_mutate(self):
         """Test mutation of code."""
         self.agent.init("AAAAAA")
@@ -88,5 +166,28 @@ class TestAgent(unittest.TestCase):
             fitness_no_match = self.agent.evaluate_fitness(target_peptide="GG")
             self.assertEqual(fitness_no_match, 6.0)  # Base fitness only
 
+    def test_evaluate_fitness_short_progeny_skips_translation(self):
+        """Test fitness skips translation when progeny is shorter than the target."""
+        self.agent.init("UUU")
+        self.agent.progeny_code = "UUU"
+        with patch('genetic_strings.entropy', return_value=1.0):
+            with patch('agent._translate_tape') as mocked_translate:
+                fitness = self.agent.evaluate_fitness(target_peptide="FF")
+                mocked_translate.assert_not_called()
+        self.assertEqual(fitness, 3.0)
+
+    def test_evaluate_population(self):
+        """Test evaluate_population scores each distinct progeny code once."""
+        agents = [Agent(family_id=i) for i in range(3)]
+        for agent, progeny in zip(agents, ["UUUUUC", "UUUUUC", ""]):
+            agent.init("UUUUUC")
+            agent.progeny_code = progeny
+        with patch('genetic_strings.entropy', return_value=1.0) as mocked_entropy:
+            fitnesses = evaluate_population(agents, target_peptide="FF")
+            self.assertEqual(mocked_entropy.call_count, 1)
+        self.assertEqual(fitnesses[0], fitnesses[1])
+        self.assertGreater(fitnesses[0], 6.0)
+        self.assertEqual(fitnesses[2], 0.0)
+
 if __name__ == '__main__':
     unittest.main()
@@ -21,6 +21,11 @@ class TestChecks(unittest.TestCase):
         invalid_code = "AAAAAF"  # 'AAF' is not in INSTRUCTIONS
         self.assertFalse(checks.check_list(invalid_code))
 
+    def test_check_list_nucleotides_not_in_instructions(self):
+        """Test check_list rejects nucleotide codons missing from INSTRUCTIONS."""
+        self.assertFalse(checks.check_list("AAATTT"))  # 'TTT' is not in INSTRUCTIONS
+        self.assertTrue(checks.check_list("AAAATC"))
+
     def test_check_list_wrong_length(self):
         """Test check_list with a code string of incorrect length."""
         invalid_code = "AAAA"  # Length 4, not a multiple of CODON_SIZE (3)
@@ -50,5 +55,11 @@ class TestChecks(unittest.TestCase):
         instructions = [parameters.OPERATIONS["STOP"][0], parameters.OPERATIONS["COPY"][0]]
         self.assertFalse(checks.is_executable(instructions))
 
+    def test_is_executable_stop_before_start(self):
+        """Test is_executable ignores a STOP that precedes every START."""
+        start, stop = parameters.OPERATIONS["START"][0], parameters.OPERATIONS["STOP"][0]
+        self.assertFalse(checks.is_executable([stop, start, "UUU"]))
+        self.assertTrue(checks.is_executable([stop, start, "UUU", stop]))
+
 if __name__ == '__main__':
     unittest.main()
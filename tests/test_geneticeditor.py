@@ -8,30 +8,37 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 import unittest
 from unittest.mock import patch, MagicMock
-from PyQt5.QtWidgets import QApplication, QTextBrowser, QTableWidgetItem
+from PyQt5.QtWidgets import QApplication, QTextBrowser, QTableWidget, QTableWidgetItem
 from geneticeditor import Ui_MainWindow
 import parameters
 
 class TestGeneticEditor(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
-        """Initialize QApplication for all tests."""
-        cls.app = QApplication(sys.argv)
+        """Initialize QApplication and the GUI element mocks for all tests."""
+        cls.app = QApplication.instance() or QApplication(sys.argv)
+        # Spec'd mocks introspect the Qt class, so build them once and reset per test
+        cls.mocks = {
+            "compiledWindow": MagicMock(spec=QTextBrowser),
+            "codeWindow": MagicMock(spec=QTextBrowser),
+            "tableData": MagicMock(),
+            "statusbar": MagicMock(),
+            "a": MagicMock(),  # Mock agent
+        }
 
     @classmethod
     def tearDownClass(cls):
         """Clean up QApplication."""
+        del cls.mocks
         del cls.app
 
     def setUp(self):
         """Set up test environment."""
         self.ui = Ui_MainWindow()
         # Mock GUI elements
-        self.ui.compiledWindow = MagicMock(spec=QTextBrowser)
-        self.ui.codeWindow = MagicMock(spec=QTextBrowser)
-        self.ui.tableData = MagicMock()
-        self.ui.statusbar = MagicMock()
-        self.ui.a = MagicMock()  # Mock agent
+        for name, mock in self.mocks.items():
+            mock.reset_mock(return_value=True, side_effect=True)
+            setattr(self.ui, name, mock)
 
     def test_compile_code_valid(self):
         """Test compileCode with valid high-level code."""
@@ -68,9 +75,32 @@ class TestGeneticEditor(unittest.TestCase):
         with patch("interpreter.tokenize_code", return_value=["AAA", "AAA"]):
             self.ui.loadData()
             self.ui.tableData.setColumnCount.assert_called_with(2)
-            self.ui.tableData.insertRow.assert_called()
+            self.ui.tableData.setRowCount.assert_called_with(1)
+            self.ui.tableData.insertRow.assert_not_called()
             self.ui.statusbar.showMessage.assert_called_with("Data Loaded!")
 
+    def test_load_data_batches_updates(self):
+        """Test loadData suspends and restores table updates and signals."""
+        self.ui.compiledWindow.toPlainText.return_value = "AAAAAA"
+        self.ui.a.init.return_value = True
+        self.ui.loadData()
+        self.ui.tableData.setUpdatesEnabled.assert_called_with(True)
+        self.ui.tableData.blockSignals.assert_called_with(False)
+        self.assertEqual(self.ui.tableData.setUpdatesEnabled.call_args_list[0].args, (False,))
+
+    def test_load_data_reuses_items(self):
+        """Test reloading keeps existing table items and updates changed cells."""
+        self.ui.tableData = QTableWidget()
+        self.ui.a.init.return_value = True
+        self.ui.compiledWindow.toPlainText.return_value = "AAAUUU"
+        self.ui.loadData()
+        first = self.ui.tableData.item(0, 0)
+        self.ui.compiledWindow.toPlainText.return_value = "AAAGGGCCC"
+        self.ui.loadData()
+        self.assertIs(self.ui.tableData.item(0, 0), first)
+        self.assertEqual([self.ui.tableData.item(0, col).text() for col in range(3)],
+                         ["AAA", "GGG", "CCC"])
+
     def test_load_data_invalid(self):
         """Test loadData with invalid code."""
         self.ui.compiledWindow.toPlainText.return_value = "INVALID"
@@ -86,7 +116,8 @@ class TestGeneticEditor(unittest.TestCase):
         with patch("interpreter.tokenize_code", return_value=["AAA", "AAA"]):
             self.ui.loadProgenyCode()
             self.ui.tableData.setColumnCount.assert_called_with(2)
-            self.ui.tableData.insertRow.assert_called()
+            self.ui.tableData.setRowCount.assert_called_with(1)
+            self.ui.tableData.insertRow.assert_not_called()
             self.ui.statusbar.showMessage.assert_called_with("Data Loaded!")
 
     def test_load_progeny_code_invalid(self):
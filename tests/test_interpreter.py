@@ -10,20 +10,34 @@ import unittest
 import tempfile
 import logging
 from unittest.mock import patch
-from interpreter import compile_code, tokenize_code, decompile_code, compress_code, run_interpreter
+from interpreter import compile_code, tokenize_code, decompile_code, compress_code, run_interpreter, clear_compile_cache
 import parameters
 
 class TestInterpreter(unittest.TestCase):
-    def setUp(self):
-        """Set up test environment."""
-        self.temp_dir = tempfile.TemporaryDirectory()
-        self.input_file = os.path.join(self.temp_dir.name, "input.txt")
-        # Configure logging to match runtime
+    # Interpreter commands as (code lines, command, expected printed result)
+    COMMAND_CASES = [
+        (["START COPY STOP"], "compile", "AAAAAGAUA"),
+        (["AAAAAGAUA"], "decompile", "START COPY STOP"),
+        (["UUU"], "run", "Progeny code: UUU"),
+    ]
+
+    @classmethod
+    def setUpClass(cls):
+        """Create one temporary directory and configure logging for all tests."""
+        cls.temp_dir = tempfile.TemporaryDirectory()
+        # Configure logging to match runtime, once for the whole class
         logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+        # The interpreter script never changes, so write it once for the class
+        cls.commands_file = os.path.join(cls.temp_dir.name, "commands_input.txt")
+        with open(cls.commands_file, 'w') as f:
+            for lines, command, _ in cls.COMMAND_CASES:
+                f.write("".join(line + "\n" for line in lines + [command]))
+            f.write("quit\n")
 
-    def tearDown(self):
-        """Clean up test environment."""
-        self.temp_dir.cleanup()
+    @classmethod
+    def tearDownClass(cls):
+        """Clean up the shared temporary directory."""
+        cls.temp_dir.cleanup()
 
     def test_compile_code(self):
         """Test compile_code with high-level operations."""
@@ -39,6 +53,23 @@ class TestInterpreter(unittest.TestCase):
             self.assertEqual(result, "")
             mocked_warning.assert_called_with("Skipping invalid instruction: %s", "INVALID")
 
+    def test_compile_code_cached_still_warns(self):
+        """Test repeated compile_code calls return the same code and keep warning."""
+        lines = ["START BOGUS STOP"]
+        expected = parameters.OPERATIONS["START"][0] + parameters.OPERATIONS["STOP"][0]
+        for _ in range(2):
+            with patch('logging.Logger.warning') as mocked_warning:
+                self.assertEqual(compile_code(lines), expected)
+                mocked_warning.assert_called_once_with("Skipping invalid instruction: %s", "BOGUS")
+
+    def test_clear_compile_cache(self):
+        """Test clear_compile_cache empties the memoized results."""
+        compile_code(["START COPY STOP"])
+        self.assertEqual(decompile_code("AAAAAG"), "START COPY")
+        clear_compile_cache()
+        self.assertEqual(decompile_code.cache_info().currsize, 0)
+        self.assertEqual(compile_code(["START COPY STOP"]), "AAAAAGAUA")
+
     def test_tokenize_code(self):
         """Test tokenize_code splits code into codons."""
         code = "AAAAUA"
@@ -60,20 +91,24 @@ class TestInterpreter(unittest.TestCase):
     def test_run_interpreter_no_input(self):
         """Test run_interpreter exits on quit."""
         with patch('builtins.input', side_effect=["quit"]):
-            with patch('interpreter.logging.info') as mocked_info:
+            with self.assertLogs(level='INFO') as cm:
                 run_interpreter(verbose=False)
-                mocked_info.assert_called_with("Exiting interpreter")
-
-    def test_run_interpreter_with_input(self):
-        """Test run_interpreter processes input file."""
-        with open(self.input_file, 'w') as f:
-            f.write("UUU\nrun\nquit\n")
-        
-        with patch('interpreter.logging.info') as mocked_info:
-            run_interpreter(input_file=self.input_file, verbose=False)
-            print("Mocked info calls:", mocked_info.call_args_list)  # Debug
-            mocked_info.assert_any_call("Execution complete. Progeny code: %s", "UUU")
-            mocked_info.assert_any_call("Exiting interpreter")
+        self.assertEqual(cm.output[-1], "INFO:root:Exiting interpreter")
+
+    def test_run_interpreter_commands(self):
+        """Test one interpreter session runs every command from the input file."""
+        with self.assertLogs(level='INFO') as cm:
+            with patch('builtins.print') as mocked_print:
+                run_interpreter(input_file=self.commands_file, verbose=False)
+        # Commands read from a file are echoed with a "> " prompt; skip those
+        printed = [call.args[0] for call in mocked_print.call_args_list
+                   if not call.args[0].startswith("> ")]
+        for (lines, command, expected), output in zip(self.COMMAND_CASES, printed):
+            with self.subTest(command=command):
+                self.assertEqual(output, expected)
+        self.assertEqual(len(printed), len(self.COMMAND_CASES))
+        self.assertIn("INFO:root:Execution complete. Progeny code: UUU", cm.output)
+        self.assertEqual(cm.output[-1], "INFO:root:Exiting interpreter")
 
 if __name__ == '__main__':
     unittest.main()
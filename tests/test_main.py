@@ -9,39 +9,54 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 import unittest
 import tempfile
 import logging
-from unittest.mock import patch
-from main import load_input_file, write_output_file, run_simulation, run_interpreter
+from unittest.mock import patch, MagicMock
+from main import load_input_file, write_output_file, run_simulation, main
 from simulation import Simulation
 from agent import Agent
 import parameters
 
 class TestMain(unittest.TestCase):
-    def setUp(self):
-        """Set up test environment."""
-        self.temp_dir = tempfile.TemporaryDirectory()
-        self.input_file = os.path.join(self.temp_dir.name, "input.txt")
-        self.output_file = os.path.join(self.temp_dir.name, "output.txt")
-        # Configure logging to match runtime
+    @classmethod
+    def setUpClass(cls):
+        """Create one temporary directory and configure logging for all tests."""
+        cls.temp_dir = tempfile.TemporaryDirectory()
+        # Configure logging to match runtime, once for the whole class
         logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+        cls.log_level = logging.getLogger().level
         logging.getLogger().setLevel(logging.CRITICAL)  # Suppress logging during tests
+        # Fixed-content input files are written once and only read by the tests
+        cls.ops_file = cls._write_input("ops_input.txt", "START COPY STOP\n# Comment\nAAA\n")
+        cls.codes_file = cls._write_input("codes_input.txt", "AAAAAA\nAAAATC")
+
+    @classmethod
+    def tearDownClass(cls):
+        """Clean up the shared temporary directory and restore the log level."""
+        logging.getLogger().setLevel(cls.log_level)
+        cls.temp_dir.cleanup()
 
-    def tearDown(self):
-        """Clean up test environment."""
-        self.temp_dir.cleanup()
+    @classmethod
+    def _write_input(cls, name, content):
+        """Write a shared input file into the temporary directory and return its path."""
+        path = os.path.join(cls.temp_dir.name, name)
+        with open(path, 'w') as f:
+            f.write(content)
+        return path
+
+    def setUp(self):
+        """Set up test environment."""
+        # Name output files after the test so tests never see each other's output
+        self.output_file = os.path.join(self.temp_dir.name, self._testMethodName + "_output.txt")
 
     def test_load_input_file(self):
         """Test load_input_file reads and compiles codes by default."""
-        with open(self.input_file, 'w') as f:
-            f.write("START COPY STOP\n# Comment\nAAA\n")
-        
         # Test with default compilation
-        codes = load_input_file(self.input_file)
+        codes = load_input_file(self.ops_file)
         expected = [parameters.OPERATIONS["START"][0] + parameters.OPERATIONS["COPY"][0] + 
                     parameters.OPERATIONS["STOP"][0], "AAA"]
         self.assertEqual(codes, expected)
         
         # Test without compilation
-        codes = load_input_file(self.input_file, should_compile=False)
+        codes = load_input_file(self.ops_file, should_compile=False)
         self.assertEqual(codes, ["START COPY STOP", "AAA"])
 
     def test_load_input_file_nonexistent(self):
@@ -49,23 +64,35 @@ class TestMain(unittest.TestCase):
         codes = load_input_file("nonexistent.txt")
         self.assertEqual(codes, [])
 
+    def _canned_agent(self):
+        """Build a finished agent to stand in for a simulation result."""
+        agent = Agent(family_id=1)
+        agent.init("AAAAAA")
+        agent.progeny_code = "AAAAAA"
+        return agent
+
+    def _mock_simulation(self, best_agent):
+        """Build a Simulation mock that reports best_agent without evolving anything."""
+        sim = MagicMock(spec=Simulation)
+        sim.generation = 1
+        sim.run_simulation.return_value = best_agent
+        sim.evaluate_fitness.return_value = 1.5
+        return sim
+
     def test_write_output_file(self):
         """Test write_output_file saves correct results."""
-        sim = Simulation(population_size=2, max_generations=1, max_steps=100, 
-                         initial_codes=["AAAAAA"])
-        best_agent = sim.run_simulation()
+        best_agent = self._canned_agent()
+        sim = self._mock_simulation(best_agent)
         
         write_output_file(self.output_file, 1, best_agent, sim)
         with open(self.output_file, 'r') as f:
             content = f.read()
-        self.assertIn("Run 1", content)
-        if best_agent:
-            self.assertIn(f"family_id={best_agent.family_id}", content)
-            self.assertIn(f"Code: {best_agent.code}", content)
+        self.assertEqual(content, "Run 1, Generation 1, Best Agent (family_id=1), Fitness: 1.500, "
+                                  "Code: AAAAAA, Progeny Code: AAAAAA\n")
 
     def test_write_output_file_no_agent(self):
         """Test write_output_file handles no valid agents."""
-        sim = Simulation(population_size=0, max_generations=1, max_steps=100)
+        sim = Simulation(population_size=0, max_generations=1, max_steps=10)
         write_output_file(self.output_file, 1, None, sim)
         with open(self.output_file, 'r') as f:
             content = f.read()
@@ -73,19 +100,52 @@ class TestMain(unittest.TestCase):
 
     def test_run_simulation_default(self):
         """Test run_simulation with default settings."""
-        with patch('logging.Logger.info') as mocked_info:
-            run_simulation(population_size=10, generations=1, max_steps=100, max_runs=1,
-                           input_file=None, output_file=None, verbose=False)
-            self.assertTrue(mocked_info.called)
+        sim = self._mock_simulation(self._canned_agent())
+        with patch('main.Simulation', return_value=sim) as mocked_simulation:
+            with patch('logging.Logger.info') as mocked_info:
+                run_simulation(population_size=10, generations=1, max_steps=10, max_runs=1,
+                               input_file=None, output_file=None, verbose=False)
+                self.assertTrue(mocked_info.called)
+        mocked_simulation.assert_called_once()
+        kwargs = mocked_simulation.call_args.kwargs
+        self.assertEqual(kwargs["population_size"], 10)
+        self.assertEqual(kwargs["elite_count"], 1)
+        self.assertEqual(kwargs["patience"], 20)
+        sim.run_simulation.assert_called_once_with()
+
+    def test_run_simulation_passes_elitism_and_patience(self):
+        """Test run_simulation forwards elite_count and patience to Simulation."""
+        sim = self._mock_simulation(self._canned_agent())
+        with patch('main.Simulation', return_value=sim) as mocked_simulation:
+            run_simulation(population_size=10, generations=1, max_steps=10, max_runs=1,
+                           input_file=None, output_file=None, verbose=False,
+                           elite_count=0, patience=None)
+        kwargs = mocked_simulation.call_args.kwargs
+        self.assertEqual(kwargs["elite_count"], 0)
+        self.assertIsNone(kwargs["patience"])
+        sim.run_simulation.assert_called_once_with()
+
+    def test_main_cross_reference_passes_elitism_and_patience(self):
+        """Test main forwards --elite-count and --patience in cross-reference mode."""
+        argv = ["main.py", "--mode", "cross-reference", "--elite-count", "0", "--patience", "0"]
+        with patch('sys.argv', argv), patch('logging.FileHandler'):
+            with patch('main.cross_reference.run_cross_reference') as mocked_run:
+                main()
+        kwargs = mocked_run.call_args.kwargs
+        self.assertEqual(kwargs["elite_count"], 0)
+        self.assertEqual(kwargs["patience"], 0)
+
+    def test_main_rejects_negative_patience(self):
+        """Test main exits with a usage error for a negative --patience."""
+        with patch('sys.argv', ["main.py", "--patience", "-1"]), patch('sys.stderr'):
+            with self.assertRaises(SystemExit):
+                main()
 
     def test_run_simulation_with_input_output(self):
         """Test run_simulation with input and output files."""
-        with open(self.input_file, 'w') as f:
-            f.write("AAAAAA\nAAAATC")
-        
         with patch('logging.Logger.info') as mocked_info:
-            run_simulation(population_size=2, generations=1, max_steps=100, max_runs=1,
-                           input_file=self.input_file, output_file=self.output_file, 
+            run_simulation(population_size=2, generations=1, max_steps=10, max_runs=1,
+                           input_file=self.codes_file, output_file=self.output_file, 
                            verbose=False, should_compile=True)
             self.assertTrue(mocked_info.called)
         
@@ -93,23 +153,20 @@ class TestMain(unittest.TestCase):
             content = f.read()
         self.assertIn("Run 1", content)
 
-    def test_run_interpreter_no_input(self):
-        """Test run_interpreter without input file."""
-        with patch('builtins.input', side_effect=["quit"]):
-            with patch('interpreter.logging.info') as mocked_info:
-                run_interpreter(verbose=False)
-                mocked_info.assert_called_with("Exiting interpreter")
-
-    def test_run_interpreter_with_input(self):
-        """Test run_interpreter with input file."""
-        with open(self.input_file, 'w') as f:
-            f.write("UUU\nrun\nquit\n")
-        
-        with patch('interpreter.logging.info') as mocked_info:
-            run_interpreter(input_file=self.input_file, verbose=False)
-            print("Mocked info calls in test_main:", mocked_info.call_args_list)  # Debug
-            mocked_info.assert_any_call("Execution complete. Progeny code: %s", "UUU")
-            mocked_info.assert_any_call("Exiting interpreter")
+    def test_run_simulation_appends_each_run(self):
+        """Test run_simulation appends one result line per run to the output file."""
+        with open(self.output_file, 'w') as f:
+            f.write("Previous results\n")
+
+        run_simulation(population_size=2, generations=1, max_steps=10, max_runs=3,
+                       input_file=None, output_file=self.output_file, verbose=False)
+
+        with open(self.output_file, 'r') as f:
+            lines = f.read().splitlines()
+        self.assertEqual(len(lines), 4)
+        self.assertEqual(lines[0], "Previous results")
+        for run, line in enumerate(lines[1:], start=1):
+            self.assertTrue(line.startswith(f"Run {run}"))
 
 if __name__ == '__main__':
     unittest.main()
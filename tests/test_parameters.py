@@ -7,6 +7,10 @@ import os
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 import unittest
+import copy
+import importlib
+import itertools
+from unittest.mock import patch
 import parameters
 
 class TestParameters(unittest.TestCase):
@@ -45,39 +49,82 @@ class TestParameters(unittest.TestCase):
             "STOP": ["AUA", "ATC", "ATG"]
         }
         self.assertEqual(parameters.OPERATIONS, expected_ops)
-        all_op_codons = set(sum(parameters.OPERATIONS.values(), []))
-        self.assertTrue(all(codon in parameters.INSTRUCTIONS for codon in all_op_codons))
+        self.assertTrue(parameters.ALL_OP_CODONS.issubset(parameters.INSTRUCTIONS))
 
     def test_no_ops(self):
         """Test the NO_OPS set."""
-        all_op_codons = set(sum(parameters.OPERATIONS.values(), []))
-        expected_no_ops = set(parameters.INSTRUCTIONS) - all_op_codons
+        expected_no_ops = set(parameters.INSTRUCTIONS) - parameters.ALL_OP_CODONS
         self.assertEqual(parameters.NO_OPS, expected_no_ops)
-        self.assertEqual(len(parameters.NO_OPS), len(parameters.INSTRUCTIONS) - len(all_op_codons))
+        self.assertEqual(len(parameters.NO_OPS), len(parameters.INSTRUCTIONS) - len(parameters.ALL_OP_CODONS))
+
+    def test_all_op_codons(self):
+        """Test ALL_OP_CODONS holds every operation codon."""
+        all_op_codons = set(itertools.chain.from_iterable(parameters.OPERATIONS.values()))
+        self.assertIsInstance(parameters.ALL_OP_CODONS, frozenset)
+        self.assertEqual(parameters.ALL_OP_CODONS, all_op_codons)
+        self.assertEqual(parameters.VALID_NUCLEOTIDES, frozenset("ATGCU"))
+
+    def test_operation_sets(self):
+        """Test OPERATION_SETS mirrors OPERATIONS as frozensets."""
+        self.assertEqual(set(parameters.OPERATION_SETS), set(parameters.OPERATIONS))
+        for op, codons in parameters.OPERATIONS.items():
+            self.assertIsInstance(parameters.OPERATION_SETS[op], frozenset)
+            self.assertEqual(parameters.OPERATION_SETS[op], frozenset(codons))
+
+    def _snapshot_parameters(self):
+        """Restore the mutable parameters globals when the test finishes, even on failure."""
+        names = ("CODON_SIZE", "INSTRUCTIONS", "OPERATIONS", "NO_OPS")
+        snapshot = {name: copy.deepcopy(getattr(parameters, name)) for name in names}
+        for name, value in snapshot.items():
+            self.addCleanup(setattr, parameters, name, value)
+
+    def _reload_counting_validation(self, environ):
+        """Reload parameters under environ and return how often validate_parameters ran."""
+        saved = dict(vars(parameters))
+        self.addCleanup(vars(parameters).update, saved)
+        calls = []
+
+        def profile(frame, event, arg):
+            if (event == 'call' and frame.f_code.co_name == 'validate_parameters'
+                    and frame.f_globals is vars(parameters)):
+                calls.append(frame)
+
+        with patch.dict(os.environ, environ, clear=True):
+            sys.setprofile(profile)
+            try:
+                importlib.reload(parameters)
+            finally:
+                sys.setprofile(None)
+        return len(calls)
+
+    def test_import_validation_runs_by_default(self):
+        """Test importing parameters validates them when GENETIC_SKIP_VALIDATE is unset."""
+        self.assertEqual(self._reload_counting_validation({}), 1)
+
+    def test_import_validation_skipped(self):
+        """Test GENETIC_SKIP_VALIDATE=1 skips validation on import."""
+        self.assertEqual(self._reload_counting_validation({"GENETIC_SKIP_VALIDATE": "1"}), 0)
 
     def test_validate_parameters_codon_size(self):
         """Test validation raises error for invalid CODON_SIZE."""
-        original = parameters.CODON_SIZE
+        self._snapshot_parameters()
         parameters.CODON_SIZE = 4
         with self.assertRaisesRegex(ValueError, "CODON_SIZE must be 3"):
             parameters.validate_parameters()
-        parameters.CODON_SIZE = original
 
     def test_validate_parameters_duplicate_instructions(self):
         """Test validation raises error for duplicate INSTRUCTIONS."""
-        original = parameters.INSTRUCTIONS
+        self._snapshot_parameters()
         parameters.INSTRUCTIONS = ["AAA", "AAA"]
         with self.assertRaisesRegex(ValueError, "Duplicate codons found"):
             parameters.validate_parameters()
-        parameters.INSTRUCTIONS = original
 
     def test_validate_parameters_invalid_ops(self):
         """Test validation raises error for invalid operation codons."""
-        original = parameters.OPERATIONS
+        self._snapshot_parameters()
         parameters.OPERATIONS["STOP"] = ["XYZ"]
         with self.assertRaisesRegex(ValueError, "Operation codons not in INSTRUCTIONS"):
             parameters.validate_parameters()
-        parameters.OPERATIONS = original
 
 if __name__ == '__main__':
     unittest.main()
@@ -7,6 +7,7 @@ import os
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 import unittest
+import logging
 from unittest.mock import patch
 import parameters
 from simulation import Simulation
@@ -43,30 +44,159 @@ class TestSimulation(unittest.TestCase):
 
     def test_evaluate_fitness(self):
         """Test evaluate_fitness calculates entropy correctly."""
-        sim = Simulation(population_size=1, max_generations=10, max_steps=100, 
+        sim = Simulation(population_size=1, max_generations=10, max_steps=10, 
                          initial_codes=["AAAAAA"])
         agent = sim.population[0]
-        fitness = sim.evaluate_fitness(agent)
-        self.assertGreaterEqual(fitness, 0.0)
+        agent.progeny_code = "AAAAAA"
+        with patch('genetic_strings.entropy', return_value=1.0):
+            fitness = sim.evaluate_fitness(agent)
+        self.assertEqual(fitness, 6.0)
+
+    def test_evaluate_fitness_cached(self):
+        """Test evaluate_fitness scores each progeny code once."""
+        sim = Simulation(population_size=2, max_generations=10, max_steps=100, 
+                         initial_codes=["UUUUUC", "UUUUUC"])
+        for agent in sim.population:
+            agent.run_to_completion()
+        with patch('agent.Agent.evaluate_fitness', return_value=6.0) as mocked_fitness:
+            fitnesses = [sim.evaluate_fitness(agent) for agent in sim.population * 2]
+            self.assertEqual(fitnesses, [6.0] * 4)
+            self.assertEqual(mocked_fitness.call_count, 1)
+
+    def test_fitness_cache_bounded(self):
+        """Test the fitness cache keeps only the newest entries past its bound."""
+        sim = Simulation(population_size=1, max_generations=10, max_steps=100, 
+                         initial_codes=["AAAAAA"])
+        for i in range(sim._fitness_cache_size + 5):
+            sim._fitness_cache[str(i)] = float(i)
+        sim._trim_fitness_cache()
+        self.assertEqual(len(sim._fitness_cache), sim._fitness_cache_size)
+        self.assertNotIn("0", sim._fitness_cache)
+        self.assertIn(str(sim._fitness_cache_size + 4), sim._fitness_cache)
 
     def test_select_parents(self):
-        """Test select_parents returns valid parents."""
-        sim = Simulation(population_size=3, max_generations=10, max_steps=100, 
+        """Test select_parents returns the tournament winner for each slot."""
+        sim = Simulation(population_size=3, max_generations=10, max_steps=10, 
                          initial_codes=self.valid_codes + ["AAAAAA"])
-        parents = sim.select_parents()
-        self.assertEqual(len(parents), sim.population_size)
-        for parent in parents:
-            self.assertIn(parent, sim.population)
+        # Fixed fitnesses stand in for scoring; a tournament over the whole
+        # population always picks the fittest agent
+        with patch('simulation.evaluate_population', return_value=[0.0, 2.0, 1.0]):
+            parents = sim.select_parents()
+        self.assertEqual(parents, [sim.population[1]] * sim.population_size)
+
+    def test_select_parents_empty_population(self):
+        """Test select_parents returns no parents for an empty population."""
+        sim = Simulation(population_size=0, max_generations=1, max_steps=100)
+        self.assertEqual(sim.select_parents(), [])
 
     def test_run_simulation(self):
         """Test run_simulation completes and returns best agent."""
         with patch('logging.Logger.info') as mocked_info:
-            sim = Simulation(population_size=2, max_generations=1, max_steps=100, 
+            sim = Simulation(population_size=2, max_generations=1, max_steps=10, 
                              initial_codes=self.valid_codes)
             best_agent = sim.run_simulation()
             self.assertTrue(mocked_info.called)
             self.assertIn(best_agent, sim.population)
 
+    def test_run_simulation_skips_disabled_debug_logging(self):
+        """Test DYNAMIC_MODE debug messages are not built when DEBUG is disabled."""
+        original_mode = parameters.DYNAMIC_MODE
+        original_level = logging.root.level
+        parameters.DYNAMIC_MODE = True
+        logging.root.setLevel(logging.INFO)
+        try:
+            sim = Simulation(population_size=2, max_generations=2, max_steps=100, 
+                             initial_codes=self.valid_codes)
+            with patch('agent.Agent.translate_to_peptide', return_value="") as mocked_translate:
+                sim.run_simulation()
+            # Only the final "Simulation completed" info message translates
+            self.assertEqual(mocked_translate.call_count, 1)
+        finally:
+            parameters.DYNAMIC_MODE = original_mode
+            logging.root.setLevel(original_level)
+
+    def test_run_simulation_reuses_agents(self):
+        """Test run_simulation recycles retired agents instead of allocating new ones."""
+        sim = Simulation(population_size=2, max_generations=4, max_steps=100, 
+                         initial_codes=self.valid_codes)
+        with patch('simulation.Agent', wraps=Agent) as mocked_agent:
+            sim.run_simulation()
+        # Only the first generation allocates; later ones reuse retired agents
+        self.assertLessEqual(mocked_agent.call_count, sim.population_size)
+
+    def test_run_simulation_keeps_elite(self):
+        """Test the best fitness never drops between generations with elitism."""
+        sim = Simulation(population_size=4, max_generations=6, max_steps=100, 
+                         initial_codes=["UUUUUC", "AAAAAA", "GGGCCC", "UUU"])
+        best_fitnesses = []
+        population_fitness = sim._population_fitness
+
+        def record_best():
+            fitnesses = population_fitness()
+            best_fitnesses.append(max(fitnesses))
+            return fitnesses
+
+        with patch.object(sim, '_population_fitness', side_effect=record_best):
+            sim.run_simulation()
+        self.assertEqual(best_fitnesses, sorted(best_fitnesses))
+
+    def test_run_simulation_no_elite(self):
+        """Test elite_count=0 replaces the whole population each generation."""
+        sim = Simulation(population_size=2, max_generations=1, max_steps=100, 
+                         initial_codes=self.valid_codes, elite_count=0)
+        initial = list(sim.population)
+        sim.run_simulation()
+        self.assertEqual(len(sim.population), 2)
+        for agent in sim.population:
+            self.assertNotIn(agent, initial)
+
+    def test_run_simulation_single_agent_mutates(self):
+        """Test a population of one still breeds offspring instead of keeping an elite."""
+        sim = Simulation(population_size=1, max_generations=2, max_steps=10, 
+                         initial_codes=["AAAAAA"], patience=None)
+        self.assertEqual(sim.elite_count, 0)
+        with patch('genetic_strings.mutate', return_value="UUUCCC") as mocked_mutate:
+            best_agent = sim.run_simulation()
+            mocked_mutate.assert_called_once_with("AAAAAA")
+        self.assertEqual(best_agent.code, "UUUCCC")
+
+    def test_run_simulation_scores_each_generation_once(self):
+        """Test run_simulation evaluates the population once per generation."""
+        sim = Simulation(population_size=3, max_generations=4, max_steps=10, 
+                         initial_codes=self.valid_codes + ["UUU"], patience=None)
+        with patch.object(sim, '_population_fitness', wraps=sim._population_fitness) as mocked_fitness:
+            sim.run_simulation()
+        # One initial scoring plus one per generation
+        self.assertEqual(mocked_fitness.call_count, 5)
+
+    def test_non_positive_patience_disables_early_stopping(self):
+        """Test patience of 0 or less runs every generation."""
+        for patience in (0, -1):
+            with self.subTest(patience=patience):
+                sim = Simulation(population_size=2, max_generations=5, max_steps=10, 
+                                 initial_codes=self.valid_codes, patience=patience)
+                self.assertIsNone(sim.patience)
+                with patch.object(sim, '_population_fitness', return_value=[1.0, 1.0]):
+                    sim.run_simulation()
+                self.assertEqual(sim.generation, 5)
+
+    def test_run_simulation_stops_on_plateau(self):
+        """Test run_simulation stops early once the best fitness plateaus."""
+        sim = Simulation(population_size=2, max_generations=50, max_steps=100, 
+                         initial_codes=self.valid_codes, patience=3)
+        with patch.object(sim, '_population_fitness', return_value=[1.0, 1.0]):
+            sim.run_simulation()
+        # The first generation sets the best fitness; three stale ones follow
+        self.assertEqual(sim.generation, 4)
+
+    def test_run_simulation_without_patience(self):
+        """Test patience=None runs every generation."""
+        sim = Simulation(population_size=2, max_generations=5, max_steps=100, 
+                         initial_codes=self.valid_codes, patience=None)
+        with patch.object(sim, '_population_fitness', return_value=[1.0, 1.0]):
+            sim.run_simulation()
+        self.assertEqual(sim.generation, 5)
+
     def test_run_simulation_empty(self):
         """Test run_simulation with empty population."""
         with patch('logging.Logger.error') as mocked_error: